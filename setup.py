@@ -12,6 +12,22 @@ def read_readme():
             return f.read()
     return "Alpha Vantage CLI - Command-line interface for Alpha Vantage API"
 
+# Optionally compile the endpoint modules to C extensions with mypyc:
+#   pip install mypy && ALPHA_GRABBER_USE_MYPYC=1 pip install --no-build-isolation .
+def mypyc_ext_modules():
+    if os.environ.get("ALPHA_GRABBER_USE_MYPYC") != "1":
+        return []
+    from mypyc.build import mypycify
+    return mypycify([
+        "--follow-imports=silent",
+        "--ignore-missing-imports",
+        "src/alpha_grabber/endpoints/base.py",
+        "src/alpha_grabber/endpoints/stocks.py",
+        "src/alpha_grabber/endpoints/forex.py",
+        "src/alpha_grabber/endpoints/crypto.py",
+        "src/alpha_grabber/endpoints/indicators.py",
+    ])
+
 setup(
     name="alpha-grabber",
     version="1.0.0",
@@ -23,6 +39,7 @@ setup(
     url="https://github.com/example/alphavantage-cli",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    ext_modules=mypyc_ext_modules(),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -49,10 +66,21 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=22.0.0",
             "flake8>=5.0.0",
             "mypy>=1.0.0",
         ],
+        "fast": [
+            "orjson>=3.6.0",
+            "ijson>=3.1",
+        ],
+        "http2": [
+            "httpx[http2]>=0.23.0",
+        ],
+        "parquet": [
+            "pyarrow>=10.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -1,4 +1,4 @@
-"""Entry point for running alphavantage_cli as a module."""
+"""Entry point for running alpha_grabber as a module."""
 
 from .cli import cli
 
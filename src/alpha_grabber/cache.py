@@ -0,0 +1,181 @@
+"""Response caching for Alpha Vantage API requests."""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+class ResponseCache:
+    """Two-tier (memory and optional disk) TTL cache for API responses."""
+    
+    # Cache lifetime in seconds for functions whose data changes intraday
+    FUNCTION_TTLS = {
+        "GLOBAL_QUOTE": 60,
+        "CURRENCY_EXCHANGE_RATE": 60,
+        "OVERVIEW": 30 * 86400,
+    }
+    
+    # Lifetime for intraday series and indicators: one bar of the interval
+    INTERVAL_TTLS = {
+        "1min": 60,
+        "5min": 300,
+        "15min": 900,
+        "30min": 1800,
+        "60min": 3600,
+    }
+    
+    # Lifetime for intraday requests with an interval not listed above
+    INTRADAY_TTL = 60
+    
+    # Lifetime for daily/weekly/monthly series and everything else
+    DEFAULT_TTL = 86400
+    
+    # Number of responses kept in memory before the least recently used
+    # one is evicted
+    MAX_MEMORY_ENTRIES = 256
+    
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Initialize the response cache.
+        
+        Args:
+            cache_dir: Directory for the on-disk tier. If not provided,
+                      responses are only cached in memory.
+            max_entries: Maximum number of responses held in memory
+                        (default: MAX_MEMORY_ENTRIES)
+        """
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.max_entries = self.MAX_MEMORY_ENTRIES if max_entries is None else max_entries
+        self._memory: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Guards the memory tier, which is shared by the client's worker threads
+        self._lock = threading.Lock()
+    
+    def ttl_for(self, params: Dict[str, Any]) -> float:
+        """
+        Get the cache lifetime for a request.
+        
+        Args:
+            params: Query parameters for the API request
+        
+        Returns:
+            Lifetime in seconds
+        """
+        function = params.get("function")
+        if function in self.FUNCTION_TTLS:
+            return self.FUNCTION_TTLS[function]
+        interval = str(params.get("interval", ""))
+        if interval in self.INTERVAL_TTLS:
+            return self.INTERVAL_TTLS[interval]
+        if interval.endswith("min"):
+            return self.INTRADAY_TTL
+        return self.DEFAULT_TTL
+    
+    def get(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response.
+        
+        The returned dictionary is a copy, so callers may modify it freely.
+        
+        Args:
+            params: Query parameters for the API request
+        
+        Returns:
+            Cached response, or None if missing or expired
+        """
+        key = self._memory_key(params)
+        now = time.time()
+        
+        with self._lock:
+            entry = self._memory.pop(key, None)
+            if entry is not None and now < entry[0]:
+                # Re-insert as the most recently used entry
+                self._memory[key] = entry
+                return copy.deepcopy(entry[1])
+        
+        if self.cache_dir is None:
+            return None
+        
+        path = self._disk_path(self.cache_dir, params)
+        try:
+            expires_at = path.stat().st_mtime + self.ttl_for(params)
+            if now >= expires_at:
+                # Drop stale files as they are encountered
+                path.unlink()
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        self._remember(key, expires_at, data)
+        return copy.deepcopy(data)
+    
+    def set(self, params: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """
+        Store a response in the cache.
+        
+        A copy of the response is stored, so the caller's dictionary can
+        still be modified afterwards.
+        
+        Args:
+            params: Query parameters for the API request
+            data: JSON response from the API
+        """
+        ttl = self.ttl_for(params)
+        if ttl <= 0:
+            return
+        
+        self._remember(self._memory_key(params), time.time() + ttl, copy.deepcopy(data))
+        
+        if self.cache_dir is None:
+            return
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._disk_path(self.cache_dir, params), "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError:
+            # The disk tier is best effort; the memory tier still holds it
+            pass
+    
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._memory.clear()
+        
+        if self.cache_dir is not None and self.cache_dir.is_dir():
+            for path in self.cache_dir.glob("*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+    
+    def _remember(self, key: Tuple, expires_at: float, data: Dict[str, Any]) -> None:
+        """Add an entry to the memory tier, evicting the least recently used."""
+        with self._lock:
+            self._memory[key] = (expires_at, data)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+    
+    @staticmethod
+    def _memory_key(params: Dict[str, Any]) -> Tuple:
+        """Build the in-memory cache key for request parameters."""
+        return tuple(sorted(params.items()))
+    
+    @staticmethod
+    def _disk_path(cache_dir: Path, params: Dict[str, Any]) -> Path:
+        """Build the on-disk cache file path for request parameters."""
+        digest = hashlib.md5(
+            json.dumps(sorted(params.items())).encode("utf-8")
+        ).hexdigest()
+        return cache_dir / f"{digest}.json"
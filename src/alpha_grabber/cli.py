@@ -2,16 +2,37 @@
 
 import sys
 import json
-from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
 import click
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from .client import AlphaVantageClient
-from .exceptions import AlphaVantageError, APIKeyError, RateLimitError
+from .exceptions import AlphaVantageError, APIKeyError
 from .endpoints.indicators import IndicatorsEndpoint
 
 
+# Values for every command's --output-format option; parquet and feather
+# are binary and meant to be redirected to a file
+_OUTPUT_FORMATS = click.Choice(["json", "csv", "parquet", "feather"])
+
+# Indicators with a dedicated IndicatorsEndpoint method
+_INDICATOR_METHODS = {
+    "SMA": "get_sma",
+    "EMA": "get_ema",
+    "RSI": "get_rsi",
+    "MACD": "get_macd",
+    "BBANDS": "get_bbands",
+}
+
+# Indicators whose methods take no time_period
+_NO_TIME_PERIOD_INDICATORS = frozenset({"MACD"})
+
+
 def get_client(ctx):
     """Create client from deferred parameters."""
     try:
@@ -29,6 +50,70 @@ def get_client(ctx):
         sys.exit(1)
 
 
+def _write_out(payload: bytes) -> None:
+    """Write encoded output and a trailing newline straight to stdout."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout has been replaced with a text-only stream
+        sys.stdout.write(payload.decode("utf-8") + "\n")
+        return
+    
+    # Anything already written through the text layer must come first
+    sys.stdout.flush()
+    buffer.write(payload)
+    buffer.write(b"\n")
+
+
+def _echo_json(data) -> None:
+    """Write data to stdout as indented JSON without building the string."""
+    if orjson is not None:
+        # orjson encodes straight to UTF-8 bytes with identical indentation
+        _write_out(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    
+    # Non-ASCII text is written as-is, as orjson does
+    json.dump(data, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+
+
+def _emit(data, output_format: str) -> None:
+    """Print command output in the requested format."""
+    if output_format == "json":
+        _echo_json(data)
+    elif isinstance(data, bytes):
+        if sys.stdout.isatty():
+            click.echo(
+                f"Error: {output_format} output is binary; "
+                f"redirect it to a file (e.g. > data.{output_format})",
+                err=True
+            )
+            sys.exit(1)
+        # Binary files are written as-is, without a trailing newline
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data)
+    else:
+        _write_out(data.encode("utf-8"))
+
+
+def _run(ctx, call: Callable[[AlphaVantageClient], Any], output_format: str) -> None:
+    """
+    Create the client, run an API call with it and print the result.
+    
+    Args:
+        ctx: Click context holding the client parameters
+        call: Function making the API call on the client
+        output_format: Output format ('json', 'csv', 'parquet' or 'feather')
+    """
+    client = get_client(ctx)
+    try:
+        data = call(client)
+    except AlphaVantageError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+    
+    _emit(data, output_format)
+
+
 @click.group()
 @click.option(
     "--api-key",
@@ -62,25 +147,18 @@ def cli(ctx, api_key: Optional[str], config_file: Optional[str], rate_limit: flo
 @click.argument("symbol")
 @click.option(
     "--output-format",
-    type=click.Choice(["json", "csv"]),
+    type=_OUTPUT_FORMATS,
     default="json",
     help="Output format"
 )
 @click.pass_context
 def get_quote(ctx, symbol: str, output_format: str):
     """Get real-time stock quote."""
-    client = get_client(ctx)
-    try:
-        data = client.stocks.get_quote(symbol, output_format)
-        
-        if output_format == "json":
-            click.echo(json.dumps(data, indent=2))
-        else:
-            click.echo(data)
-            
-    except AlphaVantageError as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    _run(
+        ctx,
+        lambda client: client.stocks.get_quote(symbol, output_format),
+        output_format
+    )
 
 
 @cli.command()
@@ -92,7 +170,7 @@ def get_quote(ctx, symbol: str, output_format: str):
 )
 @click.option(
     "--output-format",
-    type=click.Choice(["json", "csv"]),
+    type=_OUTPUT_FORMATS,
     default="json",
     help="Output format"
 )
@@ -111,23 +189,16 @@ def get_daily(
     outputsize: str
 ):
     """Get daily time series data."""
-    client = get_client(ctx)
-    try:
-        data = client.stocks.get_daily(
+    _run(
+        ctx,
+        lambda client: client.stocks.get_daily(
             symbol,
             adjusted=adjusted,
             output_format=output_format,
             outputsize=outputsize
-        )
-        
-        if output_format == "json":
-            click.echo(json.dumps(data, indent=2))
-        else:
-            click.echo(data)
-            
-    except AlphaVantageError as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+        ),
+        output_format
+    )
 
 
 @cli.command()
@@ -145,7 +216,7 @@ def get_daily(
 )
 @click.option(
     "--output-format",
-    type=click.Choice(["json", "csv"]),
+    type=_OUTPUT_FORMATS,
     default="json",
     help="Output format"
 )
@@ -165,24 +236,17 @@ def get_intraday(
     outputsize: str
 ):
     """Get intraday time series data."""
-    client = get_client(ctx)
-    try:
-        data = client.stocks.get_intraday(
+    _run(
+        ctx,
+        lambda client: client.stocks.get_intraday(
             symbol,
             interval=interval,
             adjusted=adjusted,
             output_format=output_format,
             outputsize=outputsize
-        )
-        
-        if output_format == "json":
-            click.echo(json.dumps(data, indent=2))
-        else:
-            click.echo(data)
-            
-    except AlphaVantageError as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+        ),
+        output_format
+    )
 
 
 @cli.command()
@@ -212,7 +276,7 @@ def get_intraday(
 )
 @click.option(
     "--output-format",
-    type=click.Choice(["json", "csv"]),
+    type=_OUTPUT_FORMATS,
     default="json",
     help="Output format"
 )
@@ -227,69 +291,24 @@ def get_indicators(
     output_format: str
 ):
     """Get technical indicators."""
-    client = get_client(ctx)
-    try:
-        # Map common indicators to their specific methods
-        indicator_upper = indicator.upper()
-        
-        if indicator_upper == "SMA":
-            data = client.indicators.get_sma(
-                symbol,
-                interval=interval,
-                time_period=time_period,
-                series_type=series_type,
-                output_format=output_format
-            )
-        elif indicator_upper == "EMA":
-            data = client.indicators.get_ema(
-                symbol,
-                interval=interval,
-                time_period=time_period,
-                series_type=series_type,
-                output_format=output_format
-            )
-        elif indicator_upper == "RSI":
-            data = client.indicators.get_rsi(
-                symbol,
-                interval=interval,
-                time_period=time_period,
-                series_type=series_type,
-                output_format=output_format
-            )
-        elif indicator_upper == "MACD":
-            data = client.indicators.get_macd(
-                symbol,
-                interval=interval,
-                series_type=series_type,
-                output_format=output_format
-            )
-        elif indicator_upper == "BBANDS":
-            data = client.indicators.get_bbands(
-                symbol,
-                interval=interval,
-                time_period=time_period,
-                series_type=series_type,
-                output_format=output_format
-            )
-        else:
-            # Use generic indicator method
-            data = client.indicators.get_indicator(
-                indicator,
-                symbol,
-                interval=interval,
-                time_period=time_period,
-                series_type=series_type,
-                output_format=output_format
-            )
-        
-        if output_format == "json":
-            click.echo(json.dumps(data, indent=2))
-        else:
-            click.echo(data)
-            
-    except AlphaVantageError as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    # Map common indicators to their specific methods
+    indicator_upper = indicator.upper()
+    kwargs: Dict[str, Any] = {
+        "interval": interval,
+        "series_type": series_type,
+        "output_format": output_format,
+    }
+    if indicator_upper not in _NO_TIME_PERIOD_INDICATORS:
+        kwargs["time_period"] = time_period
+    
+    def call(client):
+        method_name = _INDICATOR_METHODS.get(indicator_upper)
+        if method_name is not None:
+            return getattr(client.indicators, method_name)(symbol, **kwargs)
+        # Use generic indicator method
+        return client.indicators.get_indicator(indicator, symbol, **kwargs)
+    
+    _run(ctx, call, output_format)
 
 
 @cli.command()
@@ -297,7 +316,7 @@ def get_indicators(
 @click.argument("to_currency")
 @click.option(
     "--output-format",
-    type=click.Choice(["json", "csv"]),
+    type=_OUTPUT_FORMATS,
     default="json",
     help="Output format"
 )
@@ -315,29 +334,12 @@ def get_forex(
     daily: bool
 ):
     """Get forex exchange rates or time series data."""
-    client = get_client(ctx)
-    try:
-        if daily:
-            data = client.forex.get_daily(
-                from_currency,
-                to_currency,
-                output_format=output_format
-            )
-        else:
-            data = client.forex.get_exchange_rate(
-                from_currency,
-                to_currency,
-                output_format=output_format
-            )
-        
-        if output_format == "json":
-            click.echo(json.dumps(data, indent=2))
-        else:
-            click.echo(data)
-            
-    except AlphaVantageError as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    def call(client):
+        endpoint = client.forex
+        method = endpoint.get_daily if daily else endpoint.get_exchange_rate
+        return method(from_currency, to_currency, output_format=output_format)
+    
+    _run(ctx, call, output_format)
 
 
 @cli.command()
@@ -345,7 +347,7 @@ def get_forex(
 @click.argument("market", default="USD")
 @click.option(
     "--output-format",
-    type=click.Choice(["json", "csv"]),
+    type=_OUTPUT_FORMATS,
     default="json",
     help="Output format"
 )
@@ -363,29 +365,12 @@ def get_crypto(
     daily: bool
 ):
     """Get cryptocurrency data."""
-    client = get_client(ctx)
-    try:
-        if daily:
-            data = client.crypto.get_daily(
-                symbol,
-                market,
-                output_format=output_format
-            )
-        else:
-            data = client.crypto.get_exchange_rate(
-                symbol,
-                market,
-                output_format=output_format
-            )
-        
-        if output_format == "json":
-            click.echo(json.dumps(data, indent=2))
-        else:
-            click.echo(data)
-            
-    except AlphaVantageError as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    def call(client):
+        endpoint = client.crypto
+        method = endpoint.get_daily if daily else endpoint.get_exchange_rate
+        return method(symbol, market, output_format=output_format)
+    
+    _run(ctx, call, output_format)
 
 
 @cli.command()
@@ -393,8 +378,7 @@ def get_crypto(
 def list_indicators(ctx):
     """List available technical indicators."""
     # This command doesn't need API access - it just lists available indicators
-    from .endpoints.indicators import IndicatorsEndpoint
-    indicators = IndicatorsEndpoint.INDICATORS
+    indicators = IndicatorsEndpoint.list_indicators()
     
     click.echo("Available Technical Indicators:")
     click.echo("=" * 50)
@@ -407,25 +391,18 @@ def list_indicators(ctx):
 @click.argument("symbol")
 @click.option(
     "--output-format",
-    type=click.Choice(["json", "csv"]),
+    type=_OUTPUT_FORMATS,
     default="json",
     help="Output format"
 )
 @click.pass_context
 def get_overview(ctx, symbol: str, output_format: str):
     """Get company overview and fundamental data."""
-    client = get_client(ctx)
-    try:
-        data = client.stocks.get_overview(symbol, output_format)
-        
-        if output_format == "json":
-            click.echo(json.dumps(data, indent=2))
-        else:
-            click.echo(data)
-            
-    except AlphaVantageError as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    _run(
+        ctx,
+        lambda client: client.stocks.get_overview(symbol, output_format),
+        output_format
+    )
 
 
 @cli.command()
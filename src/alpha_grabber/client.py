@@ -1,10 +1,41 @@
 """Main client class for Alpha Vantage API."""
 
+import asyncio
+import functools
 import os
+import random
+import threading
 import time
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, Tuple, Type
+from urllib.parse import quote, urlencode, urlsplit, urlunsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import (
+    HTTPError as Urllib3HTTPError,
+    MaxRetryError,
+    NewConnectionError,
+    ProtocolError,
+    ReadTimeoutError,
+)
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:
+    ijson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
 
+from .cache import ResponseCache
 from .config import Config
 from .exceptions import (
     AlphaVantageError,
@@ -19,15 +50,63 @@ from .endpoints.crypto import CryptoEndpoint
 from .endpoints.indicators import IndicatorsEndpoint
 
 
+# Top-level response keys carrying API errors (see _check_api_errors)
+_ERROR_KEYS = ("Error Message", "Information", "Note")
+
+# Transport exceptions of the requests and (optional) httpx backends
+_TIMEOUT_ERRORS: Tuple[Type[BaseException], ...] = (requests.exceptions.Timeout,)
+_CONNECTION_ERRORS: Tuple[Type[BaseException], ...] = (requests.exceptions.ConnectionError,)
+_HTTP_STATUS_ERRORS: Tuple[Type[BaseException], ...] = (requests.exceptions.HTTPError,)
+_REQUEST_ERRORS: Tuple[Type[BaseException], ...] = (requests.exceptions.RequestException,)
+# Failures to open a connection, raised before the request is sent
+_CONNECT_ERRORS: Tuple[Type[BaseException], ...] = (requests.exceptions.ConnectTimeout,)
+if httpx is not None:
+    _TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    _CONNECTION_ERRORS += (httpx.NetworkError,)
+    _HTTP_STATUS_ERRORS += (httpx.HTTPStatusError,)
+    _REQUEST_ERRORS += (httpx.HTTPError,)
+    _CONNECT_ERRORS += (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+def _is_connect_error(error: BaseException) -> bool:
+    """
+    Check whether a transport error means the request was never sent.
+    
+    requests reports refused connections and DNS failures as a plain
+    ConnectionError wrapping urllib3's NewConnectionError, while errors
+    after sending (e.g. "Connection aborted" mid-response) wrap other
+    reasons.
+    """
+    if isinstance(error, _CONNECT_ERRORS):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError) or not error.args:
+        return False
+    reason = error.args[0]
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, NewConnectionError)
+
+
 class AlphaVantageClient:
     """Main client for interacting with the Alpha Vantage API."""
     
+    # Exponential backoff settings for retrying rate-limited requests
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 60.0
+    RETRY_JITTER = 1.0
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         rate_limit_delay: Optional[float] = None,
         config_file: Optional[str] = None,
+        use_cache: Optional[bool] = None,
+        cache_dir: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        use_http2: Optional[bool] = None,
+        rate_limit_burst: Optional[int] = None,
     ):
         """
         Initialize the Alpha Vantage client.
@@ -38,6 +117,20 @@ class AlphaVantageClient:
             base_url: Base URL for Alpha Vantage API. Defaults to official URL.
             rate_limit_delay: Delay between requests in seconds. Defaults to 12s for free tier.
             config_file: Path to configuration file.
+            use_cache: Whether to cache responses. Defaults to the
+                      cache_enabled config value (enabled).
+            cache_dir: Directory for persisting cached responses. If not
+                      provided, responses are only cached in memory.
+            max_concurrency: Maximum number of requests in flight for the
+                      async (aget_*) endpoint methods. Defaults to 4.
+            max_retries: Number of times to retry a rate-limited request
+                      with exponential backoff. Defaults to 5.
+            use_http2: Whether to send requests over HTTP/2 with httpx,
+                      multiplexing concurrent requests on one connection.
+                      Defaults to the use_http2 config value (disabled).
+            rate_limit_burst: Number of requests that may be sent back to back
+                      after an idle period before rate_limit_delay spacing
+                      applies. Defaults to 1 (no bursting).
         """
         self.config = Config(config_file)
         
@@ -61,19 +154,54 @@ class AlphaVantageClient:
             self.config.get("base_url", "https://www.alphavantage.co/query")
         )
         
+        # Encode the fixed part of every request URL once, keeping any query
+        # string already on the base URL (e.g. a proxy's own parameters)
+        url = urlsplit(self.base_url)
+        query = f"{url.query}&" if url.query else ""
+        query += f"apikey={quote(self.api_key, safe='')}&"
+        self._url_prefix = urlunsplit(url._replace(query=query, fragment=""))
+        
         # Set rate limiting
         self.rate_limit_delay = (
             rate_limit_delay or
             float(self.config.get("rate_limit_delay", 12.0))
         )
-        self._last_request_time = 0.0
+        self.rate_limit_burst = (
+            rate_limit_burst or
+            self.config.get_int("rate_limit_burst", 1)
+        )
+        
+        # Token bucket refilled at one token per rate_limit_delay seconds
+        self._tokens = float(self.rate_limit_burst)
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        
+        # Set retrying of rate-limited requests
+        self.max_retries = (
+            max_retries if max_retries is not None
+            else self.config.get_int("max_retries", 5)
+        )
+        
+        # Set concurrency for async requests
+        self.max_concurrency = (
+            max_concurrency or
+            self.config.get_int("max_concurrency", 4)
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Set response caching
+        if use_cache is None:
+            use_cache = self.config.get_bool("cache_enabled", True)
+        self.cache = (
+            ResponseCache(cache_dir or self.config.get("cache_dir"))
+            if use_cache else None
+        )
         
         # Initialize session for connection pooling
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "alpha-grabber/1.0.0",
-            "Accept": "application/json",
-        })
+        if use_http2 is None:
+            use_http2 = self.config.get_bool("use_http2", False)
+        self.use_http2 = use_http2
+        self.session = self._create_session()
         
         # Initialize endpoint handlers
         self.stocks = StocksEndpoint(self)
@@ -81,21 +209,132 @@ class AlphaVantageClient:
         self.crypto = CryptoEndpoint(self)
         self.indicators = IndicatorsEndpoint(self)
     
+    def _create_session(self) -> Any:
+        """
+        Create the HTTP session shared by all requests.
+        
+        Returns:
+            An httpx.Client when use_http2 is set, otherwise a requests.Session
+            
+        Raises:
+            AlphaVantageError: If HTTP/2 is requested but httpx is missing
+        """
+        headers = {
+            "User-Agent": "alpha-grabber/1.0.0",
+            "Accept": "application/json",
+        }
+        
+        if self.use_http2:
+            if httpx is None:
+                raise AlphaVantageError(
+                    "HTTP/2 support requires httpx. "
+                    "Install it with: pip install 'alpha-grabber[http2]'"
+                )
+            # Concurrent requests share a single multiplexed connection;
+            # connection failures are retried by the transport. The limits
+            # only matter if the server falls back to HTTP/1.1, and idle
+            # connections are kept as long as the server's keep-alive allows.
+            return httpx.Client(
+                headers=headers,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=3,
+                    limits=httpx.Limits(
+                        max_connections=self.max_concurrency,
+                        max_keepalive_connections=self.max_concurrency,
+                        keepalive_expiry=75.0,
+                    ),
+                ),
+            )
+        
+        session = requests.Session()
+        session.headers.update(headers)
+        
+        # Keep connections alive across calls and retry transient server
+        # errors; throttling (429) is left to the backoff in _make_request.
+        # Every worker thread gets its own pooled connection to the API
+        # host, so concurrent requests never evict each other's sockets.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max(10, self.max_concurrency),
+            pool_block=False,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=(500, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        
+        return session
+    
     def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+        """
+        Enforce rate limiting between requests.
         
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            time.sleep(sleep_time)
+        Uses a token bucket holding up to rate_limit_burst tokens, refilled
+        at one token per rate_limit_delay seconds; a request takes a token,
+        sleeping only when the bucket is empty.
+        """
+        if self.rate_limit_delay <= 0:
+            return
         
-        self._last_request_time = time.time()
+        # Concurrent async requests share the same bucket
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.rate_limit_burst),
+                self._tokens + (now - self._last_refill) / self.rate_limit_delay
+            )
+            self._last_refill = now
+            
+            if self._tokens < 1.0:
+                sleep_time = (1.0 - self._tokens) * self.rate_limit_delay
+                time.sleep(sleep_time)
+                self._tokens = 1.0
+                self._last_refill = now + sleep_time
+            
+            self._tokens -= 1.0
+    
+    def _refund_rate_limit(self) -> None:
+        """Return the token taken by _rate_limit for a request that was not sent."""
+        with self._rate_lock:
+            self._tokens = min(float(self.rate_limit_burst), self._tokens + 1.0)
+    
+    async def _run_async(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking endpoint call without blocking the event loop.
+        
+        Calls run on a thread pool bounded by max_concurrency, so they share
+        the client's session, cache and rate limiting.
+        
+        Args:
+            func: Blocking callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            Result of func
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="alpha-grabber",
+            )
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
     
     def _make_request(
         self, 
         params: Dict[str, Any], 
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        stream_keys: Optional[Tuple[str, ...]] = None,
+        bypass_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Make a request to the Alpha Vantage API.
@@ -103,6 +342,60 @@ class AlphaVantageClient:
         Args:
             params: Query parameters for the API request
             timeout: Request timeout in seconds
+            stream_keys: Prefixes of the response key to keep. If given and
+                    ijson is installed, the response is parsed as a stream
+                    and only the first matching key (plus any error
+                    message) is kept.
+            bypass_cache: Fetch a fresh response even if one is cached; the
+                    fresh response still replaces the cached one.
+            
+        Returns:
+            JSON response from the API
+            
+        Raises:
+            APIKeyError: If API key is invalid
+            RateLimitError: If rate limit is exceeded
+            InvalidSymbolError: If symbol is invalid
+            NetworkError: If network request fails
+            AlphaVantageError: For other API errors
+        """
+        # Serve repeated requests from the cache without touching the quota
+        if self.cache is not None and not bypass_cache:
+            cached = self.cache.get(params)
+            if cached is not None:
+                return cached
+        
+        # Back off and retry while the API reports throttling
+        attempt = 0
+        while True:
+            try:
+                data = self._send_request(params, timeout, stream_keys)
+                break
+            except RateLimitError as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+                time.sleep(self._backoff_delay(attempt))
+                attempt += 1
+        
+        if self.cache is not None:
+            self.cache.set(params, data)
+        
+        return data
+    
+    def _send_request(
+        self,
+        params: Dict[str, Any],
+        timeout: float = 30.0,
+        stream_keys: Optional[Tuple[str, ...]] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a single request to the Alpha Vantage API.
+        
+        Args:
+            params: Query parameters for the API request
+            timeout: Request timeout in seconds
+            stream_keys: Prefixes of the response key to keep when
+                    stream-parsing (see _make_request)
             
         Returns:
             JSON response from the API
@@ -117,21 +410,25 @@ class AlphaVantageClient:
         # Enforce rate limiting
         self._rate_limit()
         
-        # Add API key to parameters
-        params = params.copy()
-        params["apikey"] = self.api_key
+        # httpx has no stream flag on get(), so it always parses in full
+        if ijson is None or self.use_http2:
+            stream_keys = None
         
         try:
-            response = self.session.get(
-                self.base_url,
-                params=params,
-                timeout=timeout
-            )
+            if stream_keys is not None:
+                response = self.session.get(
+                    self._build_url(params), timeout=timeout, stream=True
+                )
+            else:
+                response = self.session.get(self._build_url(params), timeout=timeout)
             response.raise_for_status()
             
             # Parse JSON response
             try:
-                data = response.json()
+                if stream_keys is not None:
+                    data = self._parse_json_stream(response, stream_keys)
+                else:
+                    data = self._parse_json(response)
             except ValueError as e:
                 raise AlphaVantageError(f"Invalid JSON response: {e}")
             
@@ -140,20 +437,132 @@ class AlphaVantageClient:
             
             return data
             
-        except requests.exceptions.Timeout:
+        except _TIMEOUT_ERRORS as e:
+            if _is_connect_error(e):
+                # The request never reached the API, so it cost no quota
+                self._refund_rate_limit()
             raise NetworkError("Request timed out")
-        except requests.exceptions.ConnectionError:
+        except _CONNECTION_ERRORS as e:
+            if _is_connect_error(e):
+                self._refund_rate_limit()
             raise NetworkError("Connection error")
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 401:
+        except _HTTP_STATUS_ERRORS as e:
+            # Status errors of both backends carry the failed response
+            status_code = e.response.status_code  # type: ignore[attr-defined]
+            if status_code == 401:
                 raise APIKeyError("Invalid API key")
-            elif e.response.status_code == 429:
+            elif status_code == 429:
                 raise RateLimitError("Rate limit exceeded")
             else:
-                raise NetworkError(f"HTTP error {e.response.status_code}: {e}")
-        except requests.exceptions.RequestException as e:
+                raise NetworkError(f"HTTP error {status_code}: {e}")
+        except _REQUEST_ERRORS as e:
             raise NetworkError(f"Request failed: {e}")
     
+    @staticmethod
+    def _parse_json(response: requests.Response) -> Dict[str, Any]:
+        """
+        Decode a JSON response body.
+        
+        Uses orjson when it is installed, which parses large (outputsize=full)
+        payloads several times faster than the standard library.
+        
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    @staticmethod
+    def _parse_json_stream(
+        response: requests.Response,
+        keys: Tuple[str, ...]
+    ) -> Dict[str, Any]:
+        """
+        Incrementally decode the top level of a JSON response body.
+        
+        Only the first entry whose key starts with one of keys is kept,
+        along with any API error message; other entries (e.g. "Meta Data")
+        are dropped as they are parsed, and reading stops once the wanted
+        entry is complete.
+        
+        Raises:
+            ValueError: If the body is not valid JSON
+            requests.exceptions.RequestException: If reading the body fails
+                partway, mapped as requests does for its own body reads
+        """
+        # Let urllib3 undo any gzip/deflate transfer encoding
+        response.raw.decode_content = True
+        
+        data = {}
+        try:
+            for key, value in ijson.kvitems(response.raw, "", use_float=True):
+                if key in _ERROR_KEYS:
+                    data[key] = value
+                elif key.startswith(keys):
+                    data[key] = value
+                    break
+        except ijson.JSONError as e:
+            raise ValueError(str(e))
+        except ReadTimeoutError as e:
+            raise requests.exceptions.ReadTimeout(e)
+        except ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        except Urllib3HTTPError as e:
+            raise requests.exceptions.ConnectionError(e)
+        finally:
+            response.close()
+        
+        return data
+    
+    def _build_url(self, params: Dict[str, Any]) -> str:
+        """
+        Build the full request URL for the given query parameters.
+        
+        Only the per-request parameters are encoded; the base URL and API
+        key prefix is encoded once at construction.
+        
+        Args:
+            params: Query parameters for the API request
+            
+        Returns:
+            Request URL including the API key
+        """
+        query = urlencode(
+            [(key, value) for key, value in params.items() if value is not None]
+        )
+        return self._url_prefix + query
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Get the delay before retrying a rate-limited request.
+        
+        Args:
+            attempt: Number of retries already made
+            
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2 ** attempt)
+        return delay + random.uniform(0, self.RETRY_JITTER)
+    
+    @staticmethod
+    def _is_retryable(error: RateLimitError) -> bool:
+        """Check whether waiting can clear a rate limit error."""
+        # A spent daily quota will not recover within the backoff window
+        return "per day" not in str(error).lower()
+    
+    @staticmethod
+    def _is_rate_limit_message(message: str) -> bool:
+        """Check whether an API message reports throttling."""
+        message = message.lower()
+        return (
+            "rate limit" in message or
+            "frequent" in message or
+            "requests per day" in message or
+            "per minute" in message
+        )
+    
     def _check_api_errors(self, data: Dict[str, Any]) -> None:
         """
         Check API response for errors.
@@ -178,7 +587,10 @@ class AlphaVantageClient:
         # Check for information/note about API key
         if "Information" in data:
             info_msg = data["Information"]
-            if "API key" in info_msg:
+            # Quota messages also mention the API key, so check them first
+            if self._is_rate_limit_message(info_msg):
+                raise RateLimitError(info_msg)
+            elif "API key" in info_msg:
                 raise APIKeyError(info_msg)
             elif "premium" in info_msg.lower() or "subscription" in info_msg.lower():
                 raise AlphaVantageError(f"Premium feature required: {info_msg}")
@@ -188,7 +600,7 @@ class AlphaVantageClient:
         # Check for rate limiting note
         if "Note" in data:
             note_msg = data["Note"]
-            if "rate limit" in note_msg.lower() or "frequent" in note_msg.lower() or "requests per day" in note_msg.lower():
+            if self._is_rate_limit_message(note_msg):
                 raise RateLimitError(note_msg)
             else:
                 raise AlphaVantageError(note_msg)
@@ -202,6 +614,11 @@ class AlphaVantageClient:
         self.close()
     
     def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the HTTP session and release async worker threads."""
+        # __init__ may have failed before the executor attribute was set
+        executor = getattr(self, '_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+            self._executor = None
         if hasattr(self, 'session'):
             self.session.close()
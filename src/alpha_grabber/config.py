@@ -17,20 +17,39 @@ class Config:
             config_file: Path to configuration file. If not provided,
                         will look for config.ini in current directory.
         """
-        self.config = ConfigParser()
+        self._config_file = config_file
+        self._config: Optional[ConfigParser] = None
+    
+    @property
+    def config(self) -> ConfigParser:
+        """
+        Parsed configuration, loaded on first access.
         
-        # Default configuration
-        self.config.read_dict({
-            "DEFAULT": {
-                "base_url": "https://www.alphavantage.co/query",
-                "rate_limit_delay": "12.0",
-                "output_format": "json",
-                "timeout": "30.0",
-            }
-        })
+        Clients given every setting explicitly never read the file.
+        """
+        if self._config is None:
+            # Values are used verbatim; nothing relies on %(name)s interpolation
+            self._config = ConfigParser(interpolation=None)
+            
+            # Default configuration
+            self._config.read_dict({
+                "DEFAULT": {
+                    "base_url": "https://www.alphavantage.co/query",
+                    "rate_limit_delay": "12.0",
+                    "rate_limit_burst": "1",
+                    "output_format": "json",
+                    "timeout": "30.0",
+                    "cache_enabled": "true",
+                    "max_concurrency": "4",
+                    "max_retries": "5",
+                    "use_http2": "false",
+                }
+            })
+            
+            # Load configuration file
+            self._load_config_file(self._config_file)
         
-        # Load configuration file
-        self._load_config_file(config_file)
+        return self._config
     
     def _load_config_file(self, config_file: Optional[str]) -> None:
         """
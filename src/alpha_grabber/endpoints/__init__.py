@@ -1,11 +1,13 @@
 """Alpha Vantage API endpoint handlers."""
 
+from .base import BaseEndpoint
 from .stocks import StocksEndpoint
 from .forex import ForexEndpoint
 from .crypto import CryptoEndpoint
 from .indicators import IndicatorsEndpoint
 
 __all__ = [
+    "BaseEndpoint",
     "StocksEndpoint",
     "ForexEndpoint", 
     "CryptoEndpoint",
@@ -0,0 +1,91 @@
+"""Shared plumbing for Alpha Vantage endpoint handlers."""
+
+import asyncio
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Tuple
+
+from ..exceptions import AlphaVantageError
+from ..utils import format_output
+
+
+class BaseEndpoint:
+    """Base class for endpoint handlers."""
+    
+    __slots__ = ("client",)
+    
+    # Response key holding the time series for each API function; keys
+    # may use request parameters as str.format fields (e.g. {interval})
+    _TIME_SERIES_KEYS: ClassVar[Dict[str, str]] = {}
+    
+    # Prefixes of time series keys, scanned for if the expected key is missing
+    _TIME_SERIES_PREFIXES: ClassVar[Tuple[str, ...]] = ("Time Series",)
+    
+    # Error raised when a response carries no time series
+    _NO_TIME_SERIES_MESSAGE = "No time series data found in response"
+    
+    def __init__(self, client):
+        """Initialize with client reference."""
+        self.client = client
+    
+    def _fetch_time_series(self, params: Dict[str, Any], output_format: str) -> Any:
+        """
+        Request a time series and format it for output.
+        
+        The response key is looked up from the class's _TIME_SERIES_KEYS
+        table for the requested function.
+        
+        Args:
+            params: Query parameters for the API request
+            output_format: Output format ('json' or 'csv')
+        
+        Returns:
+            Time series data in requested format
+        
+        Raises:
+            AlphaVantageError: If the response holds no time series
+        """
+        time_series_key: Optional[str] = (
+            self._TIME_SERIES_KEYS[params["function"]].format(**params)
+        )
+        
+        if params.get("outputsize") == "full":
+            # Full histories can run to megabytes; parse only the series
+            data = self.client._make_request(
+                params,
+                stream_keys=(time_series_key,) + self._TIME_SERIES_PREFIXES
+            )
+        else:
+            data = self.client._make_request(params)
+        
+        # Scan for another time series key only as a fallback
+        if time_series_key not in data:
+            time_series_key = next(
+                (key for key in data if key.startswith(self._TIME_SERIES_PREFIXES)),
+                None
+            )
+        
+        if not time_series_key:
+            raise AlphaVantageError(self._NO_TIME_SERIES_MESSAGE)
+        
+        return format_output(data[time_series_key], output_format)
+    
+    def _run_concurrently(
+        self,
+        func: Callable[..., Any],
+        items: Iterable[Any],
+        **kwargs
+    ) -> List[Any]:
+        """
+        Call an async endpoint method once per item and wait for all results.
+        
+        Args:
+            func: Async endpoint method taking the item as first argument
+            items: Values to call func with
+            **kwargs: Additional arguments passed to every call
+            
+        Returns:
+            Results in the same order as items
+        """
+        async def run_all():
+            return await asyncio.gather(*(func(item, **kwargs) for item in items))
+        
+        return asyncio.run(run_all())
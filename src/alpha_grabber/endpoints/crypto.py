@@ -1,18 +1,33 @@
 """Cryptocurrency data endpoints."""
 
-from typing import Dict, Any, Optional
-import pandas as pd
+from typing import Any, List
 
 from ..exceptions import AlphaVantageError
 from ..utils import format_output
+from .base import BaseEndpoint
 
 
-class CryptoEndpoint:
+class CryptoEndpoint(BaseEndpoint):
     """Handler for cryptocurrency data endpoints."""
     
-    def __init__(self, client):
-        """Initialize with client reference."""
-        self.client = client
+    __slots__ = ()
+    
+    # Response key holding the time series for each API function
+    _TIME_SERIES_KEYS = {
+        "CRYPTO_INTRADAY": "Time Series Crypto ({interval})",
+        "DIGITAL_CURRENCY_DAILY": "Time Series (Digital Currency Daily)",
+        "DIGITAL_CURRENCY_WEEKLY": "Time Series (Digital Currency Weekly)",
+        "DIGITAL_CURRENCY_MONTHLY": "Time Series (Digital Currency Monthly)",
+    }
+    
+    # Prefixes of time series keys, scanned for if the expected key is missing
+    _TIME_SERIES_PREFIXES = (
+        "Time Series Crypto",
+        "Time Series (Crypto)",
+        "Time Series (Digital Currency",
+    )
+    
+    _NO_TIME_SERIES_MESSAGE = "No crypto time series data found in response"
     
     def get_exchange_rate(
         self,
@@ -76,21 +91,7 @@ class CryptoEndpoint:
             "outputsize": outputsize
         }
         
-        data = self.client._make_request(params)
-        
-        # Find time series key
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series (Crypto)" in key or "Time Series Crypto" in key:
-                time_series_key = key
-                break
-        
-        if not time_series_key:
-            raise AlphaVantageError("No crypto time series data found in response")
-        
-        time_series_data = data[time_series_key]
-        
-        return format_output(time_series_data, output_format)
+        return self._fetch_time_series(params, output_format)
     
     def get_daily(
         self,
@@ -115,21 +116,7 @@ class CryptoEndpoint:
             "market": market.upper()
         }
         
-        data = self.client._make_request(params)
-        
-        # Find time series key
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series (Digital Currency Daily)" in key:
-                time_series_key = key
-                break
-        
-        if not time_series_key:
-            raise AlphaVantageError("No crypto time series data found in response")
-        
-        time_series_data = data[time_series_key]
-        
-        return format_output(time_series_data, output_format)
+        return self._fetch_time_series(params, output_format)
     
     def get_weekly(
         self,
@@ -154,21 +141,7 @@ class CryptoEndpoint:
             "market": market.upper()
         }
         
-        data = self.client._make_request(params)
-        
-        # Find time series key
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series (Digital Currency Weekly)" in key:
-                time_series_key = key
-                break
-        
-        if not time_series_key:
-            raise AlphaVantageError("No crypto time series data found in response")
-        
-        time_series_data = data[time_series_key]
-        
-        return format_output(time_series_data, output_format)
+        return self._fetch_time_series(params, output_format)
     
     def get_monthly(
         self,
@@ -193,18 +166,41 @@ class CryptoEndpoint:
             "market": market.upper()
         }
         
-        data = self.client._make_request(params)
-        
-        # Find time series key
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series (Digital Currency Monthly)" in key:
-                time_series_key = key
-                break
-        
-        if not time_series_key:
-            raise AlphaVantageError("No crypto time series data found in response")
+        return self._fetch_time_series(params, output_format)
+    
+    def get_daily_many(self, symbols: List[str], **kwargs) -> List[Any]:
+        """
+        Get daily time series data for several symbols concurrently.
         
-        time_series_data = data[time_series_key]
+        Requests run on the client's worker pool (see max_concurrency) and
+        still share its cache and rate limiting.
         
-        return format_output(time_series_data, output_format)
+        Args:
+            symbols: Cryptocurrency symbols (e.g., ['BTC', 'ETH'])
+            **kwargs: Arguments passed to get_daily for every symbol
+            
+        Returns:
+            Daily data for each symbol, in the order given
+        """
+        return self._run_concurrently(self.aget_daily, symbols, **kwargs)
+    
+    # Async variants run on the client's bounded worker pool
+    async def aget_exchange_rate(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_exchange_rate`."""
+        return await self.client._run_async(self.get_exchange_rate, *args, **kwargs)
+    
+    async def aget_intraday(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_intraday`."""
+        return await self.client._run_async(self.get_intraday, *args, **kwargs)
+    
+    async def aget_daily(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_daily`."""
+        return await self.client._run_async(self.get_daily, *args, **kwargs)
+    
+    async def aget_weekly(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_weekly`."""
+        return await self.client._run_async(self.get_weekly, *args, **kwargs)
+    
+    async def aget_monthly(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_monthly`."""
+        return await self.client._run_async(self.get_monthly, *args, **kwargs)
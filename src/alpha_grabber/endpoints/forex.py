@@ -1,18 +1,29 @@
 """Foreign exchange data endpoints."""
 
-from typing import Dict, Any, Optional
-import pandas as pd
+from typing import Any
 
 from ..exceptions import AlphaVantageError
 from ..utils import format_output
+from .base import BaseEndpoint
 
 
-class ForexEndpoint:
+class ForexEndpoint(BaseEndpoint):
     """Handler for foreign exchange data endpoints."""
     
-    def __init__(self, client):
-        """Initialize with client reference."""
-        self.client = client
+    __slots__ = ()
+    
+    # Response key holding the time series for each API function
+    _TIME_SERIES_KEYS = {
+        "FX_INTRADAY": "Time Series FX ({interval})",
+        "FX_DAILY": "Time Series FX (Daily)",
+        "FX_WEEKLY": "Time Series FX (Weekly)",
+        "FX_MONTHLY": "Time Series FX (Monthly)",
+    }
+    
+    # Prefixes of time series keys, scanned for if the expected key is missing
+    _TIME_SERIES_PREFIXES = ("Time Series FX",)
+    
+    _NO_TIME_SERIES_MESSAGE = "No forex time series data found in response"
     
     def get_exchange_rate(
         self,
@@ -76,21 +87,7 @@ class ForexEndpoint:
             "outputsize": outputsize
         }
         
-        data = self.client._make_request(params)
-        
-        # Find time series key
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series FX" in key:
-                time_series_key = key
-                break
-        
-        if not time_series_key:
-            raise AlphaVantageError("No forex time series data found in response")
-        
-        time_series_data = data[time_series_key]
-        
-        return format_output(time_series_data, output_format)
+        return self._fetch_time_series(params, output_format)
     
     def get_daily(
         self,
@@ -118,21 +115,7 @@ class ForexEndpoint:
             "outputsize": outputsize
         }
         
-        data = self.client._make_request(params)
-        
-        # Find time series key
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series FX" in key:
-                time_series_key = key
-                break
-        
-        if not time_series_key:
-            raise AlphaVantageError("No forex time series data found in response")
-        
-        time_series_data = data[time_series_key]
-        
-        return format_output(time_series_data, output_format)
+        return self._fetch_time_series(params, output_format)
     
     def get_weekly(
         self,
@@ -157,21 +140,7 @@ class ForexEndpoint:
             "to_symbol": to_symbol.upper()
         }
         
-        data = self.client._make_request(params)
-        
-        # Find time series key
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series FX" in key:
-                time_series_key = key
-                break
-        
-        if not time_series_key:
-            raise AlphaVantageError("No forex time series data found in response")
-        
-        time_series_data = data[time_series_key]
-        
-        return format_output(time_series_data, output_format)
+        return self._fetch_time_series(params, output_format)
     
     def get_monthly(
         self,
@@ -196,18 +165,25 @@ class ForexEndpoint:
             "to_symbol": to_symbol.upper()
         }
         
-        data = self.client._make_request(params)
-        
-        # Find time series key
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series FX" in key:
-                time_series_key = key
-                break
-        
-        if not time_series_key:
-            raise AlphaVantageError("No forex time series data found in response")
-        
-        time_series_data = data[time_series_key]
-        
-        return format_output(time_series_data, output_format)
+        return self._fetch_time_series(params, output_format)
+    
+    # Async variants run on the client's bounded worker pool
+    async def aget_exchange_rate(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_exchange_rate`."""
+        return await self.client._run_async(self.get_exchange_rate, *args, **kwargs)
+    
+    async def aget_intraday(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_intraday`."""
+        return await self.client._run_async(self.get_intraday, *args, **kwargs)
+    
+    async def aget_daily(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_daily`."""
+        return await self.client._run_async(self.get_daily, *args, **kwargs)
+    
+    async def aget_weekly(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_weekly`."""
+        return await self.client._run_async(self.get_weekly, *args, **kwargs)
+    
+    async def aget_monthly(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_monthly`."""
+        return await self.client._run_async(self.get_monthly, *args, **kwargs)
@@ -1,17 +1,40 @@
 """Technical indicators endpoints."""
 
-from typing import Dict, Any, Optional
-import pandas as pd
+from typing import Any, ClassVar, Dict, List
 
 from ..exceptions import AlphaVantageError
 from ..utils import format_output
+from .base import BaseEndpoint
 
 
-class IndicatorsEndpoint:
+def _extract_tech(data: Dict[str, Any]) -> Any:
+    """
+    Get the indicator values from a technical analysis response.
+    
+    Args:
+        data: JSON response from the API
+    
+    Returns:
+        The "Technical Analysis: ..." section of the response
+    
+    Raises:
+        AlphaVantageError: If the response holds no technical analysis data
+    """
+    tech_key = next((key for key in data if key.startswith("Technical Analysis")), None)
+    
+    if not tech_key:
+        raise AlphaVantageError("No technical analysis data found in response")
+    
+    return data[tech_key]
+
+
+class IndicatorsEndpoint(BaseEndpoint):
     """Handler for technical indicators endpoints."""
     
+    __slots__ = ()
+    
     # Available technical indicators
-    INDICATORS = {
+    INDICATORS: ClassVar[Dict[str, str]] = {
         "SMA": "Simple Moving Average",
         "EMA": "Exponential Moving Average", 
         "WMA": "Weighted Moving Average",
@@ -68,9 +91,8 @@ class IndicatorsEndpoint:
         "HT_PHASOR": "Hilbert Transform - Phasor Components"
     }
     
-    def __init__(self, client):
-        """Initialize with client reference."""
-        self.client = client
+    # Indicator list for the unknown indicator error
+    _AVAILABLE_INDICATORS: ClassVar[str] = ", ".join(sorted(INDICATORS))
     
     def get_sma(
         self,
@@ -78,7 +100,8 @@ class IndicatorsEndpoint:
         interval: str = "daily",
         time_period: int = 20,
         series_type: str = "close",
-        output_format: str = "json"
+        output_format: str = "json",
+        bypass_cache: bool = False
     ) -> Any:
         """
         Get Simple Moving Average (SMA).
@@ -89,33 +112,20 @@ class IndicatorsEndpoint:
             time_period: Number of data points used to calculate the SMA
             series_type: Price type ('close', 'open', 'high', 'low')
             output_format: Output format ('json' or 'csv')
+            bypass_cache: Fetch fresh data even if a cached response exists
             
         Returns:
             SMA data in requested format
         """
-        params = {
-            "function": "SMA",
-            "symbol": symbol.upper(),
-            "interval": interval,
-            "time_period": str(time_period),
-            "series_type": series_type
-        }
-        
-        data = self.client._make_request(params)
-        
-        # Find technical analysis key
-        tech_key = None
-        for key in data.keys():
-            if "Technical Analysis" in key:
-                tech_key = key
-                break
-        
-        if not tech_key:
-            raise AlphaVantageError("No technical analysis data found in response")
-        
-        tech_data = data[tech_key]
-        
-        return format_output(tech_data, output_format)
+        return self.get_indicator(
+            "SMA",
+            symbol,
+            interval,
+            output_format,
+            bypass_cache,
+            time_period=time_period,
+            series_type=series_type
+        )
     
     def get_ema(
         self,
@@ -123,7 +133,8 @@ class IndicatorsEndpoint:
         interval: str = "daily",
         time_period: int = 20,
         series_type: str = "close",
-        output_format: str = "json"
+        output_format: str = "json",
+        bypass_cache: bool = False
     ) -> Any:
         """
         Get Exponential Moving Average (EMA).
@@ -134,32 +145,20 @@ class IndicatorsEndpoint:
             time_period: Number of data points
             series_type: Price type
             output_format: Output format ('json' or 'csv')
+            bypass_cache: Fetch fresh data even if a cached response exists
             
         Returns:
             EMA data in requested format
         """
-        params = {
-            "function": "EMA",
-            "symbol": symbol.upper(),
-            "interval": interval,
-            "time_period": str(time_period),
-            "series_type": series_type
-        }
-        
-        data = self.client._make_request(params)
-        
-        tech_key = None
-        for key in data.keys():
-            if "Technical Analysis" in key:
-                tech_key = key
-                break
-        
-        if not tech_key:
-            raise AlphaVantageError("No technical analysis data found in response")
-        
-        tech_data = data[tech_key]
-        
-        return format_output(tech_data, output_format)
+        return self.get_indicator(
+            "EMA",
+            symbol,
+            interval,
+            output_format,
+            bypass_cache,
+            time_period=time_period,
+            series_type=series_type
+        )
     
     def get_rsi(
         self,
@@ -167,7 +166,8 @@ class IndicatorsEndpoint:
         interval: str = "daily",
         time_period: int = 14,
         series_type: str = "close",
-        output_format: str = "json"
+        output_format: str = "json",
+        bypass_cache: bool = False
     ) -> Any:
         """
         Get Relative Strength Index (RSI).
@@ -178,32 +178,20 @@ class IndicatorsEndpoint:
             time_period: Number of data points
             series_type: Price type
             output_format: Output format ('json' or 'csv')
+            bypass_cache: Fetch fresh data even if a cached response exists
             
         Returns:
             RSI data in requested format
         """
-        params = {
-            "function": "RSI",
-            "symbol": symbol.upper(),
-            "interval": interval,
-            "time_period": str(time_period),
-            "series_type": series_type
-        }
-        
-        data = self.client._make_request(params)
-        
-        tech_key = None
-        for key in data.keys():
-            if "Technical Analysis" in key:
-                tech_key = key
-                break
-        
-        if not tech_key:
-            raise AlphaVantageError("No technical analysis data found in response")
-        
-        tech_data = data[tech_key]
-        
-        return format_output(tech_data, output_format)
+        return self.get_indicator(
+            "RSI",
+            symbol,
+            interval,
+            output_format,
+            bypass_cache,
+            time_period=time_period,
+            series_type=series_type
+        )
     
     def get_macd(
         self,
@@ -213,7 +201,8 @@ class IndicatorsEndpoint:
         fastperiod: int = 12,
         slowperiod: int = 26,
         signalperiod: int = 9,
-        output_format: str = "json"
+        output_format: str = "json",
+        bypass_cache: bool = False
     ) -> Any:
         """
         Get Moving Average Convergence/Divergence (MACD).
@@ -226,34 +215,22 @@ class IndicatorsEndpoint:
             slowperiod: Slow period for MACD
             signalperiod: Signal period for MACD
             output_format: Output format ('json' or 'csv')
+            bypass_cache: Fetch fresh data even if a cached response exists
             
         Returns:
             MACD data in requested format
         """
-        params = {
-            "function": "MACD",
-            "symbol": symbol.upper(),
-            "interval": interval,
-            "series_type": series_type,
-            "fastperiod": str(fastperiod),
-            "slowperiod": str(slowperiod),
-            "signalperiod": str(signalperiod)
-        }
-        
-        data = self.client._make_request(params)
-        
-        tech_key = None
-        for key in data.keys():
-            if "Technical Analysis" in key:
-                tech_key = key
-                break
-        
-        if not tech_key:
-            raise AlphaVantageError("No technical analysis data found in response")
-        
-        tech_data = data[tech_key]
-        
-        return format_output(tech_data, output_format)
+        return self.get_indicator(
+            "MACD",
+            symbol,
+            interval,
+            output_format,
+            bypass_cache,
+            series_type=series_type,
+            fastperiod=fastperiod,
+            slowperiod=slowperiod,
+            signalperiod=signalperiod
+        )
     
     def get_bbands(
         self,
@@ -264,7 +241,8 @@ class IndicatorsEndpoint:
         nbdevup: int = 2,
         nbdevdn: int = 2,
         matype: int = 0,
-        output_format: str = "json"
+        output_format: str = "json",
+        bypass_cache: bool = False
     ) -> Any:
         """
         Get Bollinger Bands (BBANDS).
@@ -278,35 +256,23 @@ class IndicatorsEndpoint:
             nbdevdn: Standard deviation multiplier for lower band
             matype: Moving average type (0=SMA, 1=EMA, etc.)
             output_format: Output format ('json' or 'csv')
+            bypass_cache: Fetch fresh data even if a cached response exists
             
         Returns:
             Bollinger Bands data in requested format
         """
-        params = {
-            "function": "BBANDS",
-            "symbol": symbol.upper(),
-            "interval": interval,
-            "time_period": str(time_period),
-            "series_type": series_type,
-            "nbdevup": str(nbdevup),
-            "nbdevdn": str(nbdevdn),
-            "matype": str(matype)
-        }
-        
-        data = self.client._make_request(params)
-        
-        tech_key = None
-        for key in data.keys():
-            if "Technical Analysis" in key:
-                tech_key = key
-                break
-        
-        if not tech_key:
-            raise AlphaVantageError("No technical analysis data found in response")
-        
-        tech_data = data[tech_key]
-        
-        return format_output(tech_data, output_format)
+        return self.get_indicator(
+            "BBANDS",
+            symbol,
+            interval,
+            output_format,
+            bypass_cache,
+            time_period=time_period,
+            series_type=series_type,
+            nbdevup=nbdevup,
+            nbdevdn=nbdevdn,
+            matype=matype
+        )
     
     def get_indicator(
         self,
@@ -314,6 +280,7 @@ class IndicatorsEndpoint:
         symbol: str,
         interval: str = "daily",
         output_format: str = "json",
+        bypass_cache: bool = False,
         **kwargs
     ) -> Any:
         """
@@ -324,6 +291,7 @@ class IndicatorsEndpoint:
             symbol: Stock symbol
             interval: Time interval
             output_format: Output format ('json' or 'csv')
+            bypass_cache: Fetch fresh data even if a cached response exists
             **kwargs: Additional parameters specific to the indicator
             
         Returns:
@@ -332,45 +300,77 @@ class IndicatorsEndpoint:
         indicator = indicator.upper()
         
         if indicator not in self.INDICATORS:
-            available = ", ".join(sorted(self.INDICATORS.keys()))
             raise AlphaVantageError(
-                f"Unknown indicator '{indicator}'. Available indicators: {available}"
+                f"Unknown indicator '{indicator}'. "
+                f"Available indicators: {self._AVAILABLE_INDICATORS}"
             )
         
+        # Additional parameters, with numeric values converted to strings
         params = {
             "function": indicator,
             "symbol": symbol.upper(),
-            "interval": interval
+            "interval": interval,
+            **{
+                key: str(value) if isinstance(value, (int, float)) else value
+                for key, value in kwargs.items()
+            }
         }
         
-        # Add additional parameters
-        params.update(kwargs)
-        
-        # Convert numeric values to strings
-        for key, value in params.items():
-            if isinstance(value, (int, float)):
-                params[key] = str(value)
-        
-        data = self.client._make_request(params)
-        
-        tech_key = None
-        for key in data.keys():
-            if "Technical Analysis" in key:
-                tech_key = key
-                break
+        data = self.client._make_request(params, bypass_cache=bypass_cache)
         
-        if not tech_key:
-            raise AlphaVantageError("No technical analysis data found in response")
+        return format_output(_extract_tech(data), output_format)
+    
+    def get_many(self, specs: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Get several technical indicators concurrently.
         
-        tech_data = data[tech_key]
+        Requests run on the client's worker pool (see max_concurrency) and
+        still share its cache and rate limiting.
         
-        return format_output(tech_data, output_format)
+        Args:
+            specs: Keyword arguments for get_indicator, one dict per request
+                   (e.g. {"indicator": "RSI", "symbol": "AAPL"})
+            
+        Returns:
+            Indicator data for each spec, in the order given
+        """
+        return self._run_concurrently(
+            lambda spec: self.aget_indicator(**spec), specs
+        )
+    
+    # Async variants run on the client's bounded worker pool
+    async def aget_sma(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_sma`."""
+        return await self.client._run_async(self.get_sma, *args, **kwargs)
+    
+    async def aget_ema(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_ema`."""
+        return await self.client._run_async(self.get_ema, *args, **kwargs)
+    
+    async def aget_rsi(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_rsi`."""
+        return await self.client._run_async(self.get_rsi, *args, **kwargs)
     
-    def list_indicators(self) -> Dict[str, str]:
+    async def aget_macd(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_macd`."""
+        return await self.client._run_async(self.get_macd, *args, **kwargs)
+    
+    async def aget_bbands(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_bbands`."""
+        return await self.client._run_async(self.get_bbands, *args, **kwargs)
+    
+    async def aget_indicator(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_indicator`."""
+        return await self.client._run_async(self.get_indicator, *args, **kwargs)
+    
+    @classmethod
+    def list_indicators(cls) -> Dict[str, str]:
         """
         Get list of available technical indicators.
         
+        Needs no client, so it can be called on the class itself.
+        
         Returns:
             Dictionary mapping indicator codes to descriptions
         """
-        return self.INDICATORS.copy()
+        return cls.INDICATORS.copy()
@@ -1,18 +1,30 @@
 """Stock market data endpoints."""
 
-from typing import Dict, Any, Optional
-import pandas as pd
+from typing import Any, List
 
 from ..exceptions import AlphaVantageError
 from ..utils import format_output
+from .base import BaseEndpoint
 
 
-class StocksEndpoint:
+class StocksEndpoint(BaseEndpoint):
     """Handler for stock market data endpoints."""
     
-    def __init__(self, client):
-        """Initialize with client reference."""
-        self.client = client
+    __slots__ = ()
+    
+    # Response key holding the time series for each API function
+    _TIME_SERIES_KEYS = {
+        "TIME_SERIES_INTRADAY": "Time Series ({interval})",
+        "TIME_SERIES_DAILY": "Time Series (Daily)",
+        "TIME_SERIES_DAILY_ADJUSTED": "Time Series (Daily)",
+        "TIME_SERIES_WEEKLY": "Weekly Time Series",
+        "TIME_SERIES_WEEKLY_ADJUSTED": "Weekly Adjusted Time Series",
+        "TIME_SERIES_MONTHLY": "Monthly Time Series",
+        "TIME_SERIES_MONTHLY_ADJUSTED": "Monthly Adjusted Time Series",
+    }
+    
+    # Prefixes of time series keys, scanned for if the expected key is missing
+    _TIME_SERIES_PREFIXES = ("Time Series", "Weekly", "Monthly")
     
     def get_quote(self, symbol: str, output_format: str = "json") -> Any:
         """
@@ -69,21 +81,7 @@ class StocksEndpoint:
             "outputsize": outputsize
         }
         
-        data = self.client._make_request(params)
-        
-        # Find time series key
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series" in key:
-                time_series_key = key
-                break
-        
-        if not time_series_key:
-            raise AlphaVantageError("No time series data found in response")
-        
-        time_series_data = data[time_series_key]
-        
-        return format_output(time_series_data, output_format)
+        return self._fetch_time_series(params, output_format)
     
     def get_daily(
         self,
@@ -112,21 +110,7 @@ class StocksEndpoint:
             "outputsize": outputsize
         }
         
-        data = self.client._make_request(params)
-        
-        # Find time series key
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series" in key:
-                time_series_key = key
-                break
-        
-        if not time_series_key:
-            raise AlphaVantageError("No time series data found in response")
-        
-        time_series_data = data[time_series_key]
-        
-        return format_output(time_series_data, output_format)
+        return self._fetch_time_series(params, output_format)
     
     def get_weekly(
         self,
@@ -152,21 +136,7 @@ class StocksEndpoint:
             "symbol": symbol.upper()
         }
         
-        data = self.client._make_request(params)
-        
-        # Find time series key
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series" in key:
-                time_series_key = key
-                break
-        
-        if not time_series_key:
-            raise AlphaVantageError("No time series data found in response")
-        
-        time_series_data = data[time_series_key]
-        
-        return format_output(time_series_data, output_format)
+        return self._fetch_time_series(params, output_format)
     
     def get_monthly(
         self,
@@ -192,21 +162,7 @@ class StocksEndpoint:
             "symbol": symbol.upper()
         }
         
-        data = self.client._make_request(params)
-        
-        # Find time series key
-        time_series_key = None
-        for key in data.keys():
-            if "Time Series" in key:
-                time_series_key = key
-                break
-        
-        if not time_series_key:
-            raise AlphaVantageError("No time series data found in response")
-        
-        time_series_data = data[time_series_key]
-        
-        return format_output(time_series_data, output_format)
+        return self._fetch_time_series(params, output_format)
     
     def get_overview(self, symbol: str, output_format: str = "json") -> Any:
         """
@@ -231,3 +187,44 @@ class StocksEndpoint:
             raise AlphaVantageError("No overview data found in response")
         
         return format_output(data, output_format)
+    
+    def get_daily_many(self, symbols: List[str], **kwargs) -> List[Any]:
+        """
+        Get daily time series data for several symbols concurrently.
+        
+        Requests run on the client's worker pool (see max_concurrency) and
+        still share its cache and rate limiting.
+        
+        Args:
+            symbols: Stock symbols
+            **kwargs: Arguments passed to get_daily for every symbol
+            
+        Returns:
+            Daily data for each symbol, in the order given
+        """
+        return self._run_concurrently(self.aget_daily, symbols, **kwargs)
+    
+    # Async variants run on the client's bounded worker pool
+    async def aget_quote(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_quote`."""
+        return await self.client._run_async(self.get_quote, *args, **kwargs)
+    
+    async def aget_intraday(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_intraday`."""
+        return await self.client._run_async(self.get_intraday, *args, **kwargs)
+    
+    async def aget_daily(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_daily`."""
+        return await self.client._run_async(self.get_daily, *args, **kwargs)
+    
+    async def aget_weekly(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_weekly`."""
+        return await self.client._run_async(self.get_weekly, *args, **kwargs)
+    
+    async def aget_monthly(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_monthly`."""
+        return await self.client._run_async(self.get_monthly, *args, **kwargs)
+    
+    async def aget_overview(self, *args, **kwargs) -> Any:
+        """Async variant of :meth:`get_overview`."""
+        return await self.client._run_async(self.get_overview, *args, **kwargs)
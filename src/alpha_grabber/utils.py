@@ -1,44 +1,82 @@
 """Utility functions for Alpha Vantage CLI."""
 
-import json
+import csv
+import functools
 import io
-from typing import Any, Dict, Union
-import pandas as pd
+import re
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TextIO, Tuple, Union
 
 from .exceptions import DataFormatError
 
+# pandas and numpy take hundreds of milliseconds to import, so they are only
+# imported by the DataFrame helpers that need them
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
-def format_output(data: Dict[str, Any], output_format: str) -> Union[str, Dict[str, Any]]:
+
+# Numbered prefix ("1. ") and whitespace in Alpha Vantage field names
+_COLUMN_PREFIX_RE = re.compile(r'^\d+\.\s*')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Characters allowed in a normalized symbol (e.g. "BRK.B", "BTC-USD")
+_SYMBOL_RE = re.compile(r'^[A-Z0-9.\-]+$')
+
+# Intervals accepted by validate_interval, and their listing for errors
+_VALID_INTERVALS = frozenset({
+    "1min", "5min", "15min", "30min", "60min",
+    "daily", "weekly", "monthly"
+})
+_VALID_INTERVALS_DISPLAY = "1min, 5min, 15min, 30min, 60min, daily, weekly, monthly"
+
+# strptime formats for Alpha Vantage timestamps, keyed by string length
+_TIMESTAMP_FORMATS = {
+    10: "%Y-%m-%d",
+    16: "%Y-%m-%d %H:%M",
+    19: "%Y-%m-%d %H:%M:%S",
+}
+
+
+def format_output(
+    data: Dict[str, Any], output_format: str
+) -> Union[str, bytes, Dict[str, Any], "pd.DataFrame"]:
     """
     Format data for output in the requested format.
     
     Args:
         data: Data dictionary to format
-        output_format: Output format ('json' or 'csv')
+        output_format: Output format ('json', 'csv', 'dataframe', 'parquet'
+                      or 'feather')
         
     Returns:
-        Formatted data as string (CSV) or dict (JSON)
+        Formatted data as string (CSV), dict (JSON), pandas DataFrame or
+        file contents as bytes (Parquet, Feather)
         
     Raises:
         DataFormatError: If formatting fails
     """
-    if output_format.lower() == "json":
-        return data
-    elif output_format.lower() == "csv":
-        return convert_to_csv(data)
-    else:
-        raise DataFormatError(f"Unsupported output format: {output_format}")
+    formatter = _FORMATTERS.get(output_format)
+    if formatter is None:
+        # Library callers may pass e.g. "CSV"; the CLI always passes lowercase
+        formatter = _FORMATTERS.get(output_format.lower())
+        if formatter is None:
+            raise DataFormatError(f"Unsupported output format: {output_format}")
+    
+    return formatter(data)
 
 
-def convert_to_csv(data: Dict[str, Any]) -> str:
+def convert_to_csv(data: Dict[str, Any], buf: Optional[TextIO] = None) -> Optional[str]:
     """
     Convert JSON data to CSV format.
     
     Args:
         data: Data dictionary to convert
+        buf: Text stream to write the CSV to as it is produced. If not
+            provided, the CSV is returned as a string.
         
     Returns:
-        CSV formatted string
+        CSV formatted string, or None if written to buf
         
     Raises:
         DataFormatError: If conversion fails
@@ -46,29 +84,135 @@ def convert_to_csv(data: Dict[str, Any]) -> str:
     try:
         # Handle different data structures
         if not data:
-            return ""
+            return "" if buf is None else None
         
         # Check if data is a time series (nested dict with dates as keys)
         if is_time_series_data(data):
-            return time_series_to_csv(data)
-        
-        # Handle flat dictionary (like quote data)
-        elif is_flat_dict(data):
-            return flat_dict_to_csv(data)
+            return time_series_to_csv(data, buf)
         
-        # Handle other structures - convert to DataFrame
+        # Handle flat dictionary (like quote data) and other structures as a
+        # single row; nested values are written in their string form
         else:
-            df = pd.DataFrame([data])
-            return df.to_csv(index=False)
+            return flat_dict_to_csv(data, buf)
             
     except Exception as e:
         raise DataFormatError(f"Failed to convert data to CSV: {e}")
 
 
+def convert_to_dataframe(data: Dict[str, Any]) -> "pd.DataFrame":
+    """
+    Convert JSON data to a pandas DataFrame.
+    
+    Args:
+        data: Data dictionary to convert
+        
+    Returns:
+        DataFrame indexed by date for time series, otherwise a single row
+        
+    Raises:
+        DataFormatError: If conversion fails
+    """
+    import pandas as pd
+    
+    try:
+        if not data:
+            return pd.DataFrame()
+        
+        if is_time_series_data(data):
+            return time_series_to_dataframe(data)
+        
+        return pd.DataFrame([data])
+        
+    except Exception as e:
+        raise DataFormatError(f"Failed to convert data to DataFrame: {e}")
+
+
+def convert_to_parquet(data: Dict[str, Any]) -> bytes:
+    """
+    Convert JSON data to a Snappy-compressed Parquet file.
+    
+    Args:
+        data: Data dictionary to convert
+        
+    Returns:
+        Parquet file contents
+        
+    Raises:
+        DataFormatError: If pyarrow is not installed or conversion fails
+    """
+    return _convert_to_binary(data, "Parquet", lambda df, buf: df.to_parquet(
+        buf, engine="pyarrow", compression="snappy", index=False
+    ))
+
+
+def convert_to_feather(data: Dict[str, Any]) -> bytes:
+    """
+    Convert JSON data to an LZ4-compressed Feather file.
+    
+    Args:
+        data: Data dictionary to convert
+        
+    Returns:
+        Feather file contents
+        
+    Raises:
+        DataFormatError: If pyarrow is not installed or conversion fails
+    """
+    return _convert_to_binary(data, "Feather", lambda df, buf: df.to_feather(
+        buf, compression="lz4"
+    ))
+
+
+def _convert_to_binary(data: Dict[str, Any], name: str, write: Callable) -> bytes:
+    """Convert data to a DataFrame and serialize it with write(df, buf)."""
+    import pandas as pd
+    
+    df = convert_to_dataframe(data)
+    
+    # Columnar formats store the date index as a regular column
+    if df.index.name == "date":
+        df = df.reset_index()
+    else:
+        # Time series are already typed; flat data (quotes, overviews)
+        # arrives as strings, so store fields that parse as numbers typed
+        for column in df.columns:
+            if not pd.api.types.is_numeric_dtype(df[column]):
+                try:
+                    df[column] = pd.to_numeric(df[column])
+                except (TypeError, ValueError):
+                    pass
+    
+    buf = io.BytesIO()
+    try:
+        write(df, buf)
+    except ImportError:
+        raise DataFormatError(
+            f"{name} output requires pyarrow. "
+            "Install it with: pip install 'alpha-grabber[parquet]'"
+        )
+    except Exception as e:
+        raise DataFormatError(f"Failed to convert data to {name}: {e}")
+    
+    return buf.getvalue()
+
+
+# Formatter for each supported output format
+_FORMATTERS = {
+    "json": lambda data: data,
+    "csv": convert_to_csv,
+    "dataframe": convert_to_dataframe,
+    "parquet": convert_to_parquet,
+    "feather": convert_to_feather,
+}
+
+
 def is_time_series_data(data: Dict[str, Any]) -> bool:
     """
     Check if data appears to be time series data.
     
+    Every entry is checked, so a payload whose later values are not dicts
+    falls back to the flat converters instead of failing mid-conversion.
+    
     Args:
         data: Data dictionary to check
         
@@ -78,23 +222,16 @@ def is_time_series_data(data: Dict[str, Any]) -> bool:
     if not isinstance(data, dict):
         return False
     
-    # Check if all keys look like dates and values are dicts
-    for key, value in data.items():
-        if isinstance(value, dict):
-            # Check if key looks like a date/timestamp
-            if (
-                "-" in key or 
-                "/" in key or 
-                ":" in key or
-                len(key) >= 8  # Minimum date length
-            ):
-                continue
-            else:
-                return False
-        else:
-            return False
-    
-    return True
+    # Check if keys look like dates/timestamps and values are dicts
+    return bool(data) and all(
+        isinstance(value, dict) and (
+            "-" in key or
+            "/" in key or
+            ":" in key or
+            len(key) >= 8  # Minimum date length
+        )
+        for key, value in data.items()
+    )
 
 
 def is_flat_dict(data: Dict[str, Any]) -> bool:
@@ -110,52 +247,153 @@ def is_flat_dict(data: Dict[str, Any]) -> bool:
     if not isinstance(data, dict):
         return False
     
-    for value in data.values():
-        if isinstance(value, dict):
-            return False
-    
-    return True
+    return not any(
+        isinstance(value, dict)
+        for value in data.values()
+    )
 
 
-def time_series_to_csv(data: Dict[str, Any]) -> str:
+def time_series_to_csv(
+    data: Dict[str, Any], buf: Optional[TextIO] = None
+) -> Optional[str]:
     """
     Convert time series data to CSV format.
     
     Args:
         data: Time series data dictionary
+        buf: Text stream to write rows to as they are produced, so a
+            full-size series is never held as one string. If not provided,
+            the CSV is returned as a string.
         
     Returns:
-        CSV formatted string
+        CSV formatted string, or None if written to buf
     """
-    # Convert to DataFrame
-    df = pd.DataFrame.from_dict(data, orient='index')
+    if buf is None:
+        out = io.StringIO()
+        time_series_to_csv(data, out)
+        return out.getvalue()
+    
+    # Columns are the union of row fields, in order of first appearance
+    columns = list(dict.fromkeys(field for row in data.values() for field in row))
     
-    # Reset index to make dates a column
-    df.reset_index(inplace=True)
-    df.rename(columns={'index': 'date'}, inplace=True)
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(["date", *columns])
     
-    # Sort by date (most recent first)
-    df.sort_values('date', ascending=False, inplace=True)
+    # Sort by date (most recent first); Alpha Vantage timestamps sort
+    # lexicographically
+    writer.writerows(
+        [date, *[row.get(column) for column in columns]]
+        for date, row in sorted(data.items(), key=itemgetter(0), reverse=True)
+    )
     
-    return df.to_csv(index=False)
+    return None
 
 
-def flat_dict_to_csv(data: Dict[str, Any]) -> str:
+def time_series_to_dataframe(data: Dict[str, Any]) -> "pd.DataFrame":
+    """
+    Convert time series data to a DataFrame with numeric columns.
+    
+    Rows are transposed into one list per column and each column is parsed
+    by a single NumPy conversion, instead of letting pandas infer object
+    columns and convert them afterwards. Volume columns are kept as int64
+    when every value is a whole number.
+    
+    Args:
+        data: Time series data dictionary
+        
+    Returns:
+        DataFrame indexed by timestamp with numeric columns
+    """
+    import pandas as pd
+    
+    rows = list(data.values())
+    timestamps = list(data.keys())
+    columns = list(dict.fromkeys(field for row in rows for field in row))
+    
+    index = pd.to_datetime(
+        timestamps,
+        format=_TIMESTAMP_FORMATS.get(len(timestamps[0])),
+        cache=True,
+    )
+    index.name = "date"
+    
+    values = {}
+    for column in columns:
+        cells = [row.get(column) for row in rows]
+        values[column] = _parse_column(cells, "volume" in column)
+    
+    return pd.DataFrame(values, index=index, columns=columns)
+
+
+def _parse_column(cells: List[Any], integral: bool = False) -> "np.ndarray":
+    """
+    Parse a column of numeric strings in one vectorized conversion.
+    
+    Args:
+        cells: Column values; missing values are None
+        integral: Whether to try parsing as int64 before float64
+        
+    Returns:
+        Parsed column, with unparseable values as NaN
+    """
+    import numpy as np
+    import pandas as pd
+    
+    if integral:
+        try:
+            return np.asarray(cells, dtype=np.int64)
+        except (TypeError, ValueError):
+            pass
+    
+    try:
+        return np.asarray(cells, dtype=np.float64)
+    except (TypeError, ValueError):
+        # Leave non-numeric values to pandas' slower coercion
+        return pd.to_numeric(pd.Series(cells), errors="coerce").to_numpy()
+
+
+def flat_dict_to_csv(
+    data: Dict[str, Any], buf: Optional[TextIO] = None
+) -> Optional[str]:
     """
     Convert flat dictionary to CSV format.
     
     Args:
         data: Flat data dictionary
+        buf: Text stream to write the CSV to. If not provided, the CSV is
+            returned as a string.
         
     Returns:
-        CSV formatted string
+        CSV formatted string, or None if written to buf
     """
-    # Create DataFrame with single row
-    df = pd.DataFrame([data])
-    return df.to_csv(index=False)
+    # Repeated quotes/overviews are served from a cache keyed by content;
+    # key order is kept since it determines the column order, and value types
+    # are part of the key since 1, 1.0 and True compare equal but render
+    # differently
+    items = tuple((key, type(value), value) for key, value in data.items())
+    try:
+        text = _flat_items_to_csv(items)
+    except TypeError:
+        # Unhashable values (e.g. lists) cannot be cached
+        text = _flat_items_to_csv.__wrapped__(items)
+    
+    if buf is None:
+        return text
+    buf.write(text)
+    return None
+
 
+@functools.lru_cache(maxsize=128)
+def _flat_items_to_csv(items: Tuple[Tuple[str, type, Any], ...]) -> str:
+    """Convert (key, type, value) items to a single-row CSV string."""
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow([key for key, _, _ in items])
+    writer.writerow([value for _, _, value in items])
+    return buf.getvalue()
 
-def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
+
+def clean_column_names(df: "pd.DataFrame") -> "pd.DataFrame":
     """
     Clean column names for better CSV output.
     
@@ -165,10 +403,11 @@ def clean_column_names(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with cleaned column names
     """
-    # Remove common prefixes from Alpha Vantage responses
-    df.columns = df.columns.str.replace(r'^\d+\.\s*', '', regex=True)  # Remove "1. " prefix
-    df.columns = df.columns.str.replace(r'\s+', '_', regex=True)  # Replace spaces with underscores
-    df.columns = df.columns.str.lower()  # Convert to lowercase
+    # Remove "1. " prefixes, replace spaces with underscores and lowercase
+    df.columns = [
+        _WHITESPACE_RE.sub('_', _COLUMN_PREFIX_RE.sub('', column)).lower()
+        for column in df.columns
+    ]
     
     return df
 
@@ -189,11 +428,17 @@ def validate_symbol(symbol: str) -> str:
     if not symbol or not isinstance(symbol, str):
         raise ValueError("Symbol must be a non-empty string")
     
+    return _normalize_symbol(symbol)
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_symbol(symbol: str) -> str:
+    """Normalize and check a symbol string (see validate_symbol)."""
     # Remove whitespace and convert to uppercase
     symbol = symbol.strip().upper()
     
     # Basic validation
-    if not symbol.isalnum() and not all(c.isalnum() or c in '-.' for c in symbol):
+    if not _SYMBOL_RE.match(symbol):
         raise ValueError(f"Invalid symbol format: {symbol}")
     
     if len(symbol) > 10:
@@ -215,20 +460,16 @@ def validate_interval(interval: str) -> str:
     Raises:
         ValueError: If interval is invalid
     """
-    valid_intervals = [
-        "1min", "5min", "15min", "30min", "60min",
-        "daily", "weekly", "monthly"
-    ]
-    
-    if interval not in valid_intervals:
+    if interval not in _VALID_INTERVALS:
         raise ValueError(
             f"Invalid interval: {interval}. "
-            f"Valid intervals: {', '.join(valid_intervals)}"
+            f"Valid intervals: {_VALID_INTERVALS_DISPLAY}"
         )
     
     return interval
 
 
+@functools.lru_cache(maxsize=1024)
 def format_currency_pair(from_currency: str, to_currency: str) -> tuple:
     """
     Format currency pair for API requests.
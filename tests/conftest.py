@@ -0,0 +1,24 @@
+"""Shared pytest configuration."""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Add the --skip-slow option."""
+    parser.addoption(
+        "--skip-slow",
+        action="store_true",
+        default=False,
+        help="skip tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests when --skip-slow is given."""
+    if not config.getoption("--skip-slow"):
+        return
+    
+    skip_slow = pytest.mark.skip(reason="skipped with --skip-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
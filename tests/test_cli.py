@@ -2,22 +2,37 @@
 
 import pytest
 import json
-from unittest.mock import Mock, patch
+import re
+from operator import attrgetter
+from unittest.mock import Mock, call, patch
 from click.testing import CliRunner
 
 from alpha_grabber.cli import cli
-from alpha_grabber.exceptions import APIKeyError, AlphaVantageError
+from alpha_grabber.exceptions import AlphaVantageError
+
+
+# How commands construct the client when given only --api-key
+DEFAULT_CLIENT_CALL = call(api_key='test_key', config_file=None, rate_limit_delay=12.0)
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """CLI runner; each invoke runs in its own isolated I/O context."""
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_client_class(monkeypatch):
+    """Replace the client class the CLI instantiates with a mock."""
+    client_class = Mock()
+    monkeypatch.setattr('alpha_grabber.cli.AlphaVantageClient', client_class)
+    return client_class
 
 
 class TestCLI:
     """Test cases for CLI commands."""
     
-    def setup_method(self):
-        """Setup test runner."""
-        self.runner = CliRunner()
-    
-    @patch('alpha_grabber.cli.AlphaVantageClient')
-    def test_get_quote_success(self, mock_client_class):
+    def test_get_quote_success(self, mock_client_class, runner):
         """Test successful quote command."""
         mock_client = Mock()
         mock_client.stocks.get_quote.return_value = {
@@ -26,239 +41,194 @@ class TestCLI:
         }
         mock_client_class.return_value = mock_client
         
-        result = self.runner.invoke(cli, [
+        result = runner.invoke(cli, [
             '--api-key', 'test_key',
             'get-quote', 'AAPL'
         ])
         
         assert result.exit_code == 0
-        assert "AAPL" in result.output
-        assert "150.00" in result.output
-        mock_client.stocks.get_quote.assert_called_once_with('AAPL', 'json')
+        assert re.search(r'"01\. symbol": "AAPL".*"05\. price": "150\.00"', result.output, re.S)
+        assert mock_client.stocks.get_quote.call_args_list == [call('AAPL', 'json')]
         # Verify client was created with correct parameters
-        mock_client_class.assert_called_once_with(
-            api_key='test_key',
-            config_file=None,
-            rate_limit_delay=12.0
-        )
+        assert mock_client_class.call_args_list == [DEFAULT_CLIENT_CALL]
     
-    @patch('alpha_grabber.cli.AlphaVantageClient')
-    def test_get_quote_csv_format(self, mock_client_class):
+    def test_get_quote_csv_format(self, mock_client_class, runner):
         """Test quote command with CSV output."""
         mock_client = Mock()
         mock_client.stocks.get_quote.return_value = "symbol,price\nAAPL,150.00"
         mock_client_class.return_value = mock_client
         
-        result = self.runner.invoke(cli, [
+        result = runner.invoke(cli, [
             '--api-key', 'test_key',
             'get-quote', 'AAPL',
             '--output-format', 'csv'
         ])
         
         assert result.exit_code == 0
-        assert "symbol,price" in result.output
-        mock_client.stocks.get_quote.assert_called_once_with('AAPL', 'csv')
-        mock_client_class.assert_called_once_with(
-            api_key='test_key',
-            config_file=None, 
-            rate_limit_delay=12.0
-        )
+        assert result.output == "symbol,price\nAAPL,150.00\n"
+        assert mock_client.stocks.get_quote.call_args_list == [call('AAPL', 'csv')]
+        assert mock_client_class.call_args_list == [DEFAULT_CLIENT_CALL]
     
-    @patch('alpha_grabber.cli.AlphaVantageClient')
-    def test_get_daily_success(self, mock_client_class):
-        """Test successful daily command."""
+    def test_get_daily_binary_format(self, mock_client_class, runner):
+        """Test binary formats are written to stdout unchanged."""
         mock_client = Mock()
-        mock_client.stocks.get_daily.return_value = {
-            "2023-01-01": {"1. open": "150.00", "4. close": "155.00"}
-        }
+        mock_client.stocks.get_daily.return_value = b"PAR1\x00PAR1"
         mock_client_class.return_value = mock_client
         
-        result = self.runner.invoke(cli, [
+        result = runner.invoke(cli, [
             '--api-key', 'test_key',
             'get-daily', 'AAPL',
-            '--adjusted'
+            '--output-format', 'parquet'
         ])
         
         assert result.exit_code == 0
-        mock_client.stocks.get_daily.assert_called_once_with(
+        assert result.stdout_bytes == b"PAR1\x00PAR1"
+        assert mock_client.stocks.get_daily.call_args_list == [call(
             'AAPL',
             adjusted=True,
-            output_format='json',
+            output_format='parquet',
             outputsize='compact'
-        )
-        mock_client_class.assert_called_once_with(
-            api_key='test_key',
-            config_file=None,
-            rate_limit_delay=12.0
-        )
-    
-    @patch('alpha_grabber.cli.AlphaVantageClient')
-    def test_get_indicators_sma(self, mock_client_class):
-        """Test indicators command with SMA."""
-        mock_client = Mock()
-        mock_client.indicators.get_sma.return_value = {
-            "2023-01-01": {"SMA": "150.00"}
-        }
-        mock_client_class.return_value = mock_client
-        
-        result = self.runner.invoke(cli, [
-            '--api-key', 'test_key',
-            'get-indicators', 'AAPL',
-            '--indicator', 'SMA',
-            '--time-period', '20'
-        ])
-        
-        assert result.exit_code == 0
-        mock_client.indicators.get_sma.assert_called_once_with(
-            'AAPL',
-            interval='daily',
-            time_period=20,
-            series_type='close',
-            output_format='json'
-        )
-        mock_client_class.assert_called_once_with(
-            api_key='test_key',
-            config_file=None,
-            rate_limit_delay=12.0
-        )
+        )]
     
-    @patch('alpha_grabber.cli.AlphaVantageClient')
-    def test_get_indicators_generic(self, mock_client_class):
-        """Test indicators command with generic indicator."""
+    @patch('alpha_grabber.cli.orjson', None)
+    def test_get_quote_json_without_orjson(self, mock_client_class, runner):
+        """Test JSON output falls back to the standard library encoder."""
         mock_client = Mock()
-        mock_client.indicators.get_indicator.return_value = {
-            "2023-01-01": {"CUSTOM": "100.00"}
-        }
+        mock_client.stocks.get_quote.return_value = {"01. symbol": "AAPL"}
         mock_client_class.return_value = mock_client
         
-        result = self.runner.invoke(cli, [
+        result = runner.invoke(cli, [
             '--api-key', 'test_key',
-            'get-indicators', 'AAPL',
-            '--indicator', 'CUSTOM',
-            '--time-period', '14'
+            'get-quote', 'AAPL'
         ])
         
         assert result.exit_code == 0
-        mock_client.indicators.get_indicator.assert_called_once_with(
-            'CUSTOM',
-            'AAPL',
-            interval='daily',
-            time_period=14,
-            series_type='close',
-            output_format='json'
-        )
-        mock_client_class.assert_called_once_with(
-            api_key='test_key',
-            config_file=None,
-            rate_limit_delay=12.0
-        )
+        assert result.output == '{\n  "01. symbol": "AAPL"\n}\n'
     
-    @patch('alpha_grabber.cli.AlphaVantageClient')
-    def test_get_forex_rate(self, mock_client_class):
-        """Test forex command for exchange rate."""
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_get_overview_json_non_ascii(
+        self, mock_client_class, runner, monkeypatch, use_orjson
+    ):
+        """Test non-ASCII text is output unescaped with either encoder."""
+        if not use_orjson:
+            monkeypatch.setattr('alpha_grabber.cli.orjson', None)
         mock_client = Mock()
-        mock_client.forex.get_exchange_rate.return_value = {
-            "1. From_Currency Code": "USD",
-            "3. To_Currency Code": "EUR",
-            "5. Exchange Rate": "0.85"
-        }
+        mock_client.stocks.get_overview.return_value = {"Name": "Nestlé S.A."}
         mock_client_class.return_value = mock_client
         
-        result = self.runner.invoke(cli, [
+        result = runner.invoke(cli, [
             '--api-key', 'test_key',
-            'get-forex', 'USD', 'EUR'
+            'get-overview', 'NSRGY'
         ])
         
         assert result.exit_code == 0
-        mock_client.forex.get_exchange_rate.assert_called_once_with(
-            'USD', 'EUR', output_format='json'
-        )
-        mock_client_class.assert_called_once_with(
-            api_key='test_key',
-            config_file=None,
-            rate_limit_delay=12.0
-        )
+        assert result.output == '{\n  "Name": "Nestlé S.A."\n}\n'
     
-    @patch('alpha_grabber.cli.AlphaVantageClient')
-    def test_get_forex_daily(self, mock_client_class):
-        """Test forex command for daily data."""
+    def test_get_daily_success(self, mock_client_class, runner):
+        """Test successful daily command."""
         mock_client = Mock()
-        mock_client.forex.get_daily.return_value = {
-            "2023-01-01": {"1. open": "0.85", "4. close": "0.86"}
+        mock_client.stocks.get_daily.return_value = {
+            "2023-01-01": {"1. open": "150.00", "4. close": "155.00"}
         }
         mock_client_class.return_value = mock_client
         
-        result = self.runner.invoke(cli, [
+        result = runner.invoke(cli, [
             '--api-key', 'test_key',
-            'get-forex', 'USD', 'EUR',
-            '--daily'
+            'get-daily', 'AAPL',
+            '--adjusted'
         ])
         
         assert result.exit_code == 0
-        mock_client.forex.get_daily.assert_called_once_with(
-            'USD', 'EUR', output_format='json'
-        )
-        mock_client_class.assert_called_once_with(
-            api_key='test_key',
-            config_file=None,
-            rate_limit_delay=12.0
-        )
+        assert result.output == json.dumps(
+            mock_client.stocks.get_daily.return_value, indent=2
+        ) + "\n"
+        assert mock_client.stocks.get_daily.call_args_list == [call(
+            'AAPL',
+            adjusted=True,
+            output_format='json',
+            outputsize='compact'
+        )]
+        assert mock_client_class.call_args_list == [DEFAULT_CLIENT_CALL]
     
-    @patch('alpha_grabber.cli.AlphaVantageClient')
-    def test_get_crypto_rate(self, mock_client_class):
-        """Test crypto command for exchange rate."""
+    @pytest.mark.parametrize("argv, method, args, kwargs", [
+        (
+            ['get-indicators', 'AAPL', '--indicator', 'SMA', '--time-period', '20'],
+            "indicators.get_sma",
+            ('AAPL',),
+            dict(interval='daily', time_period=20, series_type='close', output_format='json'),
+        ),
+        (
+            # MACD takes no time period
+            ['get-indicators', 'AAPL', '--indicator', 'macd'],
+            "indicators.get_macd",
+            ('AAPL',),
+            dict(interval='daily', series_type='close', output_format='json'),
+        ),
+        (
+            ['get-indicators', 'AAPL', '--indicator', 'CUSTOM', '--time-period', '14'],
+            "indicators.get_indicator",
+            ('CUSTOM', 'AAPL'),
+            dict(interval='daily', time_period=14, series_type='close', output_format='json'),
+        ),
+        (
+            ['get-forex', 'USD', 'EUR'],
+            "forex.get_exchange_rate",
+            ('USD', 'EUR'),
+            dict(output_format='json'),
+        ),
+        (
+            ['get-forex', 'USD', 'EUR', '--daily'],
+            "forex.get_daily",
+            ('USD', 'EUR'),
+            dict(output_format='json'),
+        ),
+        (
+            ['get-crypto', 'BTC'],
+            "crypto.get_exchange_rate",
+            ('BTC', 'USD'),
+            dict(output_format='json'),
+        ),
+    ])
+    def test_command_dispatch(self, mock_client_class, runner, argv, method, args, kwargs):
+        """Test commands call the matching endpoint method."""
         mock_client = Mock()
-        mock_client.crypto.get_exchange_rate.return_value = {
-            "1. From_Currency Code": "BTC",
-            "3. To_Currency Code": "USD",
-            "5. Exchange Rate": "45000.00"
-        }
+        attrgetter(method)(mock_client).return_value = {"2023-01-01": {"value": "1.00"}}
         mock_client_class.return_value = mock_client
         
-        result = self.runner.invoke(cli, [
-            '--api-key', 'test_key',
-            'get-crypto', 'BTC'
-        ])
+        result = runner.invoke(cli, ['--api-key', 'test_key'] + argv)
         
         assert result.exit_code == 0
-        mock_client.crypto.get_exchange_rate.assert_called_once_with(
-            'BTC', 'USD', output_format='json'
-        )
-        mock_client_class.assert_called_once_with(
-            api_key='test_key',
-            config_file=None,
-            rate_limit_delay=12.0
-        )
+        assert attrgetter(method)(mock_client).call_args_list == [call(*args, **kwargs)]
+        assert mock_client_class.call_args_list == [DEFAULT_CLIENT_CALL]
     
-    def test_list_indicators(self):
+    def test_list_indicators(self, mock_client_class, runner):
         """Test list indicators command."""
-        result = self.runner.invoke(cli, [
+        result = runner.invoke(cli, [
             'list-indicators'
         ])
         
         assert result.exit_code == 0
-        assert "SMA" in result.output
-        assert "Simple Moving Average" in result.output
-        assert "EMA" in result.output
+        assert re.search(r"SMA.*Simple Moving Average.*\bEMA\b", result.output, re.S)
         # This command doesn't need a client - it just lists static indicators
+        mock_client_class.assert_not_called()
     
-    def test_version_command(self):
+    def test_version_command(self, mock_client_class, runner):
         """Test version command."""
-        result = self.runner.invoke(cli, [
+        result = runner.invoke(cli, [
             'version'
         ])
         
         assert result.exit_code == 0
-        assert "Alpha Grabber" in result.output
-        assert "v1.0.0" in result.output
+        assert re.search(r"Alpha Grabber.*v1\.0\.0", result.output)
         # Version command doesn't need a client or API key
+        mock_client_class.assert_not_called()
     
     @patch('alpha_grabber.cli.get_client')
-    def test_api_key_error(self, mock_get_client):
+    def test_api_key_error(self, mock_get_client, runner):
         """Test CLI with API key error."""
         mock_get_client.side_effect = SystemExit(1)
         
-        result = self.runner.invoke(cli, [
+        result = runner.invoke(cli, [
             'get-quote', 'AAPL'
         ])
         
@@ -267,13 +237,13 @@ class TestCLI:
         pass  # The exit handling is done in get_client now
     
     @patch('alpha_grabber.cli.get_client')
-    def test_alpha_vantage_error_in_command(self, mock_get_client):
+    def test_alpha_vantage_error_in_command(self, mock_get_client, runner):
         """Test Alpha Vantage error during command execution."""
         mock_client = Mock()
         mock_client.stocks.get_quote.side_effect = AlphaVantageError("API error")
         mock_get_client.return_value = mock_client
         
-        result = self.runner.invoke(cli, [
+        result = runner.invoke(cli, [
             '--api-key', 'test_key',
             'get-quote', 'INVALID'
         ])
@@ -281,19 +251,18 @@ class TestCLI:
         assert result.exit_code == 1
         assert "API error" in result.output
     
-    def test_cli_help(self):
+    def test_cli_help(self, runner):
         """Test CLI help output."""
-        result = self.runner.invoke(cli, ['--help'])
+        result = runner.invoke(cli, ['--help'])
         
         assert result.exit_code == 0
-        assert "Alpha Grabber" in result.output
-        assert "get-quote" in result.output
-        assert "get-daily" in result.output
-        assert "get-indicators" in result.output
+        assert re.search(
+            r"Alpha Grabber.*get-daily.*get-indicators.*get-quote", result.output, re.S
+        )
     
-    def test_command_help(self):
+    def test_command_help(self, runner):
         """Test individual command help."""
-        result = self.runner.invoke(cli, ['get-quote', '--help'])
+        result = runner.invoke(cli, ['get-quote', '--help'])
         
         assert result.exit_code == 0
         assert "Get real-time stock quote" in result.output
@@ -1,11 +1,23 @@
 """Tests for Alpha Vantage client."""
 
 import pytest
+import asyncio
+import io
+import json
 import os
-from unittest.mock import Mock, patch, MagicMock
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 import requests
+from urllib3.exceptions import (
+    MaxRetryError,
+    NewConnectionError,
+    ProtocolError,
+    ReadTimeoutError,
+)
 
-from alpha_grabber.client import AlphaVantageClient
+from alpha_grabber.client import AlphaVantageClient, _is_connect_error
+from alpha_grabber.cache import ResponseCache
 from alpha_grabber.exceptions import (
     APIKeyError,
     RateLimitError,
@@ -15,159 +27,528 @@ from alpha_grabber.exceptions import (
 )
 
 
+def json_response(payload, status_code=200):
+    """Build a stub HTTP response carrying a JSON payload."""
+    return SimpleNamespace(
+        json=lambda: payload,
+        content=json.dumps(payload).encode("utf-8"),
+        raise_for_status=lambda: None,
+        status_code=status_code,
+    )
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Client shared by tests that don't need custom settings."""
+    with AlphaVantageClient(api_key="test_key") as shared:
+        yield shared
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(client):
+    """Clear cached responses and refill the rate limit before each test."""
+    if client.cache is not None:
+        client.cache.clear()
+    client._tokens = float(client.rate_limit_burst)
+    client._last_refill = time.monotonic()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen monotonic clock; sleeps are recorded instead of waited out."""
+    fake = SimpleNamespace(now=0.0, slept=[])
+    monkeypatch.setattr('time.monotonic', lambda: fake.now)
+    monkeypatch.setattr('time.sleep', fake.slept.append)
+    return fake
+
+
 class TestAlphaVantageClient:
     """Test cases for AlphaVantageClient."""
     
-    def test_init_with_api_key(self):
-        """Test client initialization with API key."""
-        client = AlphaVantageClient(api_key="test_key")
-        assert client.api_key == "test_key"
-        assert client.base_url == "https://www.alphavantage.co/query"
-        assert client.rate_limit_delay == 12.0
+    @pytest.mark.parametrize("env, kwargs, expected", [
+        (
+            {},
+            {"api_key": "test_key"},
+            {"api_key": "test_key", "base_url": "https://www.alphavantage.co/query",
+             "rate_limit_delay": 12.0},
+        ),
+        (
+            {"ALPHA_VANTAGE_API_KEY": "env_key"},
+            {},
+            {"api_key": "env_key"},
+        ),
+        (
+            {},
+            {"api_key": "test_key", "base_url": "https://custom.url", "rate_limit_delay": 5.0},
+            {"api_key": "test_key", "base_url": "https://custom.url", "rate_limit_delay": 5.0},
+        ),
+    ])
+    def test_init(self, monkeypatch, env, kwargs, expected):
+        """Test settings are taken from parameters, environment or defaults."""
+        monkeypatch.delenv("ALPHA_VANTAGE_API_KEY", raising=False)
+        monkeypatch.delenv("ALPHA_VANTAGE_BASE_URL", raising=False)
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        
+        client = AlphaVantageClient(**kwargs)
+        
+        assert {name: getattr(client, name) for name in expected} == expected
     
-    def test_init_without_api_key(self):
+    def test_init_without_api_key(self, monkeypatch):
         """Test client initialization without API key raises error."""
-        with patch.dict(os.environ, {}, clear=True):
-            with pytest.raises(APIKeyError):
-                AlphaVantageClient()
+        monkeypatch.delenv("ALPHA_VANTAGE_API_KEY", raising=False)
+        
+        with pytest.raises(APIKeyError):
+            AlphaVantageClient()
     
-    def test_init_with_env_var(self):
-        """Test client initialization with environment variable."""
-        with patch.dict(os.environ, {"ALPHA_VANTAGE_API_KEY": "env_key"}):
-            client = AlphaVantageClient()
-            assert client.api_key == "env_key"
+    def test_config_file_values_read_verbatim(self, tmp_path):
+        """Test config values containing '%' are not treated as interpolation."""
+        config_file = tmp_path / "config.ini"
+        config_file.write_text("[DEFAULT]\napi_key = ab%cd\n")
+        
+        with patch.dict(os.environ, {}, clear=True):
+            client = AlphaVantageClient(config_file=str(config_file))
+        
+        assert client.api_key == "ab%cd"
     
-    def test_init_with_custom_params(self):
-        """Test client initialization with custom parameters."""
+    def test_explicit_settings_skip_config_file(self):
+        """Test the config file is not parsed when every setting is given."""
         client = AlphaVantageClient(
             api_key="test_key",
             base_url="https://custom.url",
-            rate_limit_delay=5.0
+            rate_limit_delay=5.0,
+            rate_limit_burst=1,
+            use_cache=False,
+            max_concurrency=2,
+            max_retries=1,
+            use_http2=False,
         )
-        assert client.api_key == "test_key"
-        assert client.base_url == "https://custom.url"
-        assert client.rate_limit_delay == 5.0
+        
+        assert client.config._config is None
     
-    @patch('time.sleep')
-    @patch('time.time')
-    def test_rate_limiting(self, mock_time, mock_sleep):
-        """Test rate limiting functionality."""
-        # First test - should sleep full delay time  
-        mock_time.side_effect = [0.0, 10.0]  # start_time, end_time
+    def test_session_adapter(self, client):
+        """Test the session pools connections and retries server errors."""
+        adapter = client.session.get_adapter("https://www.alphavantage.co/query")
         
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert 429 not in adapter.max_retries.status_forcelist
+    
+    def test_session_pool_fits_concurrency(self):
+        """Test the connection pool holds a connection per worker thread."""
+        client = AlphaVantageClient(api_key="test_key", max_concurrency=32)
+        
+        adapter = client.session.get_adapter("https://www.alphavantage.co/query")
+        
+        assert adapter._pool_maxsize == 32
+    
+    def test_rate_limiting(self, clock):
+        """Test rate limiting functionality."""
         client = AlphaVantageClient(api_key="test_key", rate_limit_delay=10.0)
-        client._last_request_time = 0.0
         
+        # First request - the bucket starts full, so no wait
         client._rate_limit()
-        mock_sleep.assert_called_with(10.0)
+        assert clock.slept == []
         
-        # Second test - should sleep remaining time
-        mock_time.reset_mock()
-        mock_sleep.reset_mock()
-        mock_time.side_effect = [3.0, 13.0]  # 3 seconds after last request
+        # Second request - should sleep the full delay
+        client._rate_limit()
+        assert clock.slept == [10.0]
         
-        client._last_request_time = 0.0  # Last request was at time 0
+        # Third request - should sleep remaining time
+        clock.now = 13.0  # 3 seconds after last request
         client._rate_limit()
-        mock_sleep.assert_called_with(7.0)  # Should sleep 10 - 3 = 7 seconds
+        assert clock.slept[-1] == 7.0  # Should sleep 10 - 3 = 7 seconds
     
-    def test_make_request_success(self):
-        """Test successful API request."""
-        client = AlphaVantageClient(api_key="test_key")
+    def test_rate_limit_burst(self, clock):
+        """Test idle time allows a burst of requests without waiting."""
+        client = AlphaVantageClient(
+            api_key="test_key", rate_limit_delay=10.0, rate_limit_burst=3
+        )
         
+        for _ in range(3):
+            client._rate_limit()
+        assert clock.slept == []
+        
+        client._rate_limit()
+        assert clock.slept == [10.0]
+        
+        # A long idle period refills the bucket only up to its capacity
+        clock.now = 1000.0
+        for _ in range(3):
+            client._rate_limit()
+        assert clock.slept == [10.0]
+    
+    def test_make_request_success(self, client):
+        """Test successful API request."""
         # Mock successful response
-        mock_response = Mock()
-        mock_response.json.return_value = {"test": "data"}
-        mock_response.raise_for_status.return_value = None
+        mock_response = json_response({"test": "data"})
         
         with patch.object(client.session, 'get', return_value=mock_response):
             with patch.object(client, '_rate_limit'):
                 result = client._make_request({"function": "TEST"})
                 assert result == {"test": "data"}
     
-    def test_make_request_with_api_error_message(self):
-        """Test API request with error message in response."""
-        client = AlphaVantageClient(api_key="test_key")
+    def test_parse_json_without_orjson(self):
+        """Test responses fall back to the standard library parser."""
+        response = json_response({"test": "data"})
+        response.content = b""  # only response.json() can produce the payload
         
-        mock_response = Mock()
-        mock_response.json.return_value = {"Error Message": "Invalid API call"}
-        mock_response.raise_for_status.return_value = None
+        with patch('alpha_grabber.client.orjson', None):
+            assert AlphaVantageClient._parse_json(response) == {"test": "data"}
+    
+    def test_invalid_json_response(self, client):
+        """Test an unparseable body raises AlphaVantageError."""
+        mock_response = json_response(None)
+        mock_response.content = b"<html>"
+        mock_response.json = Mock(side_effect=ValueError("Expecting value"))
         
         with patch.object(client.session, 'get', return_value=mock_response):
             with patch.object(client, '_rate_limit'):
-                with pytest.raises(InvalidSymbolError):
+                with pytest.raises(AlphaVantageError, match="Invalid JSON response"):
                     client._make_request({"function": "TEST"})
     
-    def test_make_request_with_rate_limit_note(self):
-        """Test API request with rate limit note."""
-        client = AlphaVantageClient(api_key="test_key")
+    def test_stream_keeps_only_time_series(self):
+        """Test stream parsing drops entries other than the wanted series."""
+        pytest.importorskip("ijson")
+        client = AlphaVantageClient(api_key="test_key", use_cache=False)
+        
+        mock_response = Mock()
+        mock_response.raw = io.BytesIO(json.dumps({
+            "Meta Data": {"1. Information": "Daily Prices"},
+            "Time Series (Daily)": {"2023-01-01": {"1. open": "150.00"}}
+        }).encode("utf-8"))
+        
+        with patch.object(client.session, 'get', return_value=mock_response) as mock_get:
+            with patch.object(client, '_rate_limit'):
+                result = client._make_request(
+                    {"function": "TIME_SERIES_DAILY", "outputsize": "full"},
+                    stream_keys=("Time Series",)
+                )
+        
+        assert result == {"Time Series (Daily)": {"2023-01-01": {"1. open": "150.00"}}}
+        assert mock_get.call_args[1]["stream"] is True
+        mock_response.close.assert_called_once()
+    
+    def test_stream_checks_api_errors(self):
+        """Test stream parsing still surfaces API error messages."""
+        pytest.importorskip("ijson")
+        client = AlphaVantageClient(api_key="test_key", use_cache=False)
         
         mock_response = Mock()
-        mock_response.json.return_value = {"Note": "Thank you for using Alpha Vantage! Our standard API call frequency is 25 requests per day."}
-        mock_response.raise_for_status.return_value = None
+        mock_response.raw = io.BytesIO(b'{"Error Message": "Invalid API call"}')
         
         with patch.object(client.session, 'get', return_value=mock_response):
             with patch.object(client, '_rate_limit'):
-                with pytest.raises(RateLimitError):
-                    client._make_request({"function": "TEST"})
+                with pytest.raises(InvalidSymbolError):
+                    client._make_request(
+                        {"function": "TIME_SERIES_DAILY", "outputsize": "full"},
+                        stream_keys=("Time Series",)
+                    )
     
-    def test_make_request_with_api_key_info(self):
-        """Test API request with API key information."""
-        client = AlphaVantageClient(api_key="test_key")
+    @pytest.mark.parametrize("error, message", [
+        (ReadTimeoutError(None, None, "Read timed out."), "Request timed out"),
+        (ProtocolError("Connection broken"), "Request failed"),
+    ])
+    def test_stream_read_errors(self, error, message):
+        """Test transport errors while streaming the body raise NetworkError."""
+        pytest.importorskip("ijson")
+        client = AlphaVantageClient(api_key="test_key", use_cache=False)
         
         mock_response = Mock()
-        mock_response.json.return_value = {"Information": "Please visit https://www.alphavantage.co/support/#api-key to claim your free API key."}
-        mock_response.raise_for_status.return_value = None
+        mock_response.raw = Mock(spec=["read"])
+        mock_response.raw.read.side_effect = [b'{"Time Series (Daily)": {', error]
         
         with patch.object(client.session, 'get', return_value=mock_response):
             with patch.object(client, '_rate_limit'):
-                with pytest.raises(APIKeyError):
-                    client._make_request({"function": "TEST"})
+                with pytest.raises(NetworkError, match=message):
+                    client._make_request(
+                        {"function": "TIME_SERIES_DAILY", "outputsize": "full"},
+                        stream_keys=("Time Series",)
+                    )
+        
+        mock_response.close.assert_called_once()
     
-    def test_make_request_network_error(self):
-        """Test API request with network error."""
-        client = AlphaVantageClient(api_key="test_key")
+    @pytest.mark.slow
+    def test_http2_session(self):
+        """Test HTTP/2 requests go through httpx with the same error mapping."""
+        httpx = pytest.importorskip("httpx")
+        pytest.importorskip("h2")
+        client = AlphaVantageClient(
+            api_key="test_key", use_http2=True, use_cache=False, max_retries=0
+        )
+        assert isinstance(client.session, httpx.Client)
+        pool = client.session._transport._pool
+        assert pool._max_connections == client.max_concurrency
+        assert pool._keepalive_expiry == 75.0
         
-        with patch.object(client.session, 'get', side_effect=requests.exceptions.ConnectionError("Connection failed")):
+        request = httpx.Request("GET", "https://www.alphavantage.co/query")
+        ok = httpx.Response(200, json={"test": "data"}, request=request)
+        throttled = httpx.Response(429, request=request)
+        
+        with patch.object(client.session, 'get', side_effect=[ok, throttled]):
             with patch.object(client, '_rate_limit'):
-                with pytest.raises(NetworkError):
+                assert client._make_request({"function": "TEST"}) == {"test": "data"}
+                with pytest.raises(RateLimitError):
                     client._make_request({"function": "TEST"})
+        
+        client.close()
     
-    def test_make_request_timeout(self):
-        """Test API request with timeout."""
-        client = AlphaVantageClient(api_key="test_key")
+    def test_http2_requires_httpx(self):
+        """Test enabling HTTP/2 without httpx installed raises a clear error."""
+        with patch('alpha_grabber.client.httpx', None):
+            with pytest.raises(AlphaVantageError, match="requires httpx"):
+                AlphaVantageClient(api_key="test_key", use_http2=True)
+    
+    def test_build_url(self):
+        """Test request URLs carry the API key and encoded parameters."""
+        client = AlphaVantageClient(api_key="test_key", base_url="https://custom.url")
         
-        with patch.object(client.session, 'get', side_effect=requests.exceptions.Timeout("Request timed out")):
+        url = client._build_url({"function": "SMA", "symbol": "BRK.B", "interval": None})
+        
+        assert url == "https://custom.url?apikey=test_key&function=SMA&symbol=BRK.B"
+    
+    def test_build_url_keeps_base_query(self):
+        """Test a query string on the base URL is merged, not duplicated."""
+        client = AlphaVantageClient(
+            api_key="test_key", base_url="https://proxy.example/query?datatype=json"
+        )
+        
+        url = client._build_url({"function": "SMA"})
+        
+        assert url == "https://proxy.example/query?datatype=json&apikey=test_key&function=SMA"
+    
+    @pytest.mark.parametrize("payload, error", [
+        ({"Error Message": "Invalid API call"}, InvalidSymbolError),
+        ({"Note": "Thank you for using Alpha Vantage! Our standard API call frequency is 25 requests per day."}, RateLimitError),
+        ({"Information": "Please visit https://www.alphavantage.co/support/#api-key to claim your free API key."}, APIKeyError),
+    ])
+    def test_make_request_payload_errors(self, client, payload, error):
+        """Test API error messages in the response body raise matching errors."""
+        with patch.object(client.session, 'get', return_value=json_response(payload)):
+            with patch.object(client, '_rate_limit'):
+                with pytest.raises(error):
+                    client._make_request({"function": "TEST"})
+    
+    @pytest.mark.parametrize("exception", [
+        requests.exceptions.ConnectionError("Connection failed"),
+        requests.exceptions.Timeout("Request timed out"),
+    ])
+    def test_make_request_network_error(self, client, exception):
+        """Test connection failures and timeouts raise NetworkError."""
+        with patch.object(client.session, 'get', side_effect=exception):
             with patch.object(client, '_rate_limit'):
                 with pytest.raises(NetworkError):
                     client._make_request({"function": "TEST"})
     
-    def test_make_request_http_error_401(self):
-        """Test API request with 401 HTTP error."""
-        client = AlphaVantageClient(api_key="test_key")
+    @pytest.mark.parametrize("exception, refunded", [
+        (requests.exceptions.ConnectionError(MaxRetryError(
+            None, "/query", NewConnectionError(None, "Connection refused")
+        )), True),
+        (requests.exceptions.ConnectTimeout("Connection timed out"), True),
+        (requests.exceptions.ConnectionError(
+            ProtocolError("Connection aborted.")
+        ), False),
+        (requests.exceptions.ReadTimeout("Read timed out"), False),
+    ])
+    @patch('time.sleep')
+    def test_connect_error_refunds_rate_limit(self, mock_sleep, exception, refunded):
+        """Test only requests that never connected skip the next delay."""
+        client = AlphaVantageClient(api_key="test_key", use_cache=False)
         
-        mock_response = Mock()
-        mock_response.status_code = 401
-        http_error = requests.exceptions.HTTPError("401 Unauthorized")
-        http_error.response = mock_response
+        with patch.object(client.session, 'get', side_effect=exception):
+            with pytest.raises(NetworkError):
+                client._make_request({"function": "TEST"})
+        
+        with patch.object(client.session, 'get', return_value=json_response({"test": "data"})):
+            client._make_request({"function": "TEST"})
+        
+        assert mock_sleep.called is not refunded
+    
+    @pytest.mark.parametrize("name, refunded", [
+        ("ConnectError", True),
+        ("ConnectTimeout", True),
+        ("ReadError", False),
+        ("WriteError", False),
+    ])
+    def test_httpx_connect_error_refunds_rate_limit(self, name, refunded):
+        """Test httpx errors are refunded only for the connect phase."""
+        httpx = pytest.importorskip("httpx")
+        
+        assert _is_connect_error(getattr(httpx, name)("failed")) is refunded
+    
+    @pytest.mark.parametrize("status_code, error, retried", [
+        (401, APIKeyError, False),
+        (429, RateLimitError, True),
+    ])
+    def test_make_request_http_error(self, client, status_code, error, retried):
+        """Test HTTP error statuses raise matching errors."""
+        http_error = requests.exceptions.HTTPError(f"{status_code} error")
+        http_error.response = SimpleNamespace(status_code=status_code)
         
         with patch.object(client.session, 'get', side_effect=http_error):
             with patch.object(client, '_rate_limit'):
-                with pytest.raises(APIKeyError):
-                    client._make_request({"function": "TEST"})
+                with patch('alpha_grabber.client.time.sleep') as mock_sleep:
+                    with pytest.raises(error):
+                        client._make_request({"function": "TEST"})
+                    # Throttling is retried with backoff before giving up
+                    assert mock_sleep.call_count == (client.max_retries if retried else 0)
     
-    def test_make_request_http_error_429(self):
-        """Test API request with 429 HTTP error."""
-        client = AlphaVantageClient(api_key="test_key")
+    @patch('alpha_grabber.client.time.sleep')
+    def test_make_request_retries_rate_limit(self, mock_sleep, client):
+        """Test throttled requests are retried with exponential backoff."""
+        throttled = json_response({"Note": "Our standard API call frequency is 5 calls per minute."})
+        ok = json_response({"test": "data"})
         
-        mock_response = Mock()
-        mock_response.status_code = 429
-        http_error = requests.exceptions.HTTPError("429 Too Many Requests")
-        http_error.response = mock_response
+        with patch.object(client.session, 'get', side_effect=[throttled, throttled, ok]):
+            with patch.object(client, '_rate_limit'):
+                with patch('alpha_grabber.client.random.uniform', return_value=0.0):
+                    result = client._make_request({"function": "TEST"})
         
-        with patch.object(client.session, 'get', side_effect=http_error):
+        assert result == {"test": "data"}
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+    
+    @patch('alpha_grabber.client.time.sleep')
+    def test_make_request_daily_quota_not_retried(self, mock_sleep, client):
+        """Test an exhausted daily quota is raised without retrying."""
+        mock_response = json_response({"Information": "We have detected your API key as test_key and our standard API rate limit is 25 requests per day."})
+        
+        with patch.object(client.session, 'get', return_value=mock_response):
             with patch.object(client, '_rate_limit'):
                 with pytest.raises(RateLimitError):
                     client._make_request({"function": "TEST"})
+        
+        mock_sleep.assert_not_called()
+    
+    def test_make_request_cached(self, client):
+        """Test repeated requests are served from the cache."""
+        mock_response = json_response({"test": "data"})
+        
+        with patch.object(client.session, 'get', return_value=mock_response) as mock_get:
+            with patch.object(client, '_rate_limit') as mock_rate_limit:
+                first = client._make_request({"function": "TEST"})
+                second = client._make_request({"function": "TEST"})
+                
+                assert first == second == {"test": "data"}
+                mock_get.assert_called_once()
+                mock_rate_limit.assert_called_once()
+    
+    def test_make_request_bypass_cache(self, client):
+        """Test bypassing the cache fetches and stores a fresh response."""
+        responses = [json_response({"test": "old"}), json_response({"test": "new"})]
+        
+        with patch.object(client.session, 'get', side_effect=responses):
+            with patch.object(client, '_rate_limit'):
+                client._make_request({"function": "TEST"})
+                fresh = client._make_request({"function": "TEST"}, bypass_cache=True)
+        
+        assert fresh == {"test": "new"}
+        assert client._make_request({"function": "TEST"}) == {"test": "new"}
+    
+    @pytest.mark.parametrize("params, ttl", [
+        ({"function": "GLOBAL_QUOTE", "symbol": "AAPL"}, 60),
+        ({"function": "TIME_SERIES_INTRADAY", "interval": "1min"}, 60),
+        ({"function": "SMA", "interval": "60min"}, 3600),
+        ({"function": "SMA", "interval": "daily"}, 86400),
+    ])
+    def test_cache_ttl_follows_interval(self, params, ttl):
+        """Test cache lifetimes match how often the requested data changes."""
+        assert ResponseCache().ttl_for(params) == ttl
+    
+    def test_cache_returns_copies(self):
+        """Test mutating a cached response does not change the cache."""
+        cache = ResponseCache()
+        data = {"Time Series (Daily)": {"2023-01-01": {"4. close": "155.00"}}}
+        cache.set({"function": "TIME_SERIES_DAILY"}, data)
+        
+        data["Time Series (Daily)"].clear()
+        cache.get({"function": "TIME_SERIES_DAILY"})["Time Series (Daily)"].clear()
+        
+        assert cache.get({"function": "TIME_SERIES_DAILY"}) == {
+            "Time Series (Daily)": {"2023-01-01": {"4. close": "155.00"}}
+        }
+    
+    def test_cache_evicts_least_recently_used(self):
+        """Test the memory tier is bounded and keeps recently read entries."""
+        cache = ResponseCache(max_entries=2)
+        for symbol in ("A", "B"):
+            cache.set({"function": "OVERVIEW", "symbol": symbol}, {"Symbol": symbol})
+        cache.get({"function": "OVERVIEW", "symbol": "A"})
+        cache.set({"function": "OVERVIEW", "symbol": "C"}, {"Symbol": "C"})
+        
+        assert cache.get({"function": "OVERVIEW", "symbol": "A"}) == {"Symbol": "A"}
+        assert cache.get({"function": "OVERVIEW", "symbol": "B"}) is None
+        assert cache.get({"function": "OVERVIEW", "symbol": "C"}) == {"Symbol": "C"}
+    
+    def test_make_request_cache_disabled(self):
+        """Test caching can be turned off."""
+        client = AlphaVantageClient(api_key="test_key", use_cache=False)
+        
+        mock_response = json_response({"test": "data"})
+        
+        with patch.object(client.session, 'get', return_value=mock_response) as mock_get:
+            with patch.object(client, '_rate_limit'):
+                client._make_request({"function": "TEST"})
+                client._make_request({"function": "TEST"})
+                
+                assert mock_get.call_count == 2
+    
+    def test_make_request_disk_cache(self, tmp_path):
+        """Test cached responses persist across clients via the disk tier."""
+        client = AlphaVantageClient(api_key="test_key", cache_dir=str(tmp_path))
+        
+        mock_response = json_response({"test": "data"})
+        
+        with patch.object(client.session, 'get', return_value=mock_response):
+            with patch.object(client, '_rate_limit'):
+                client._make_request({"function": "TEST"})
+        
+        other = AlphaVantageClient(api_key="test_key", cache_dir=str(tmp_path))
+        with patch.object(other.session, 'get') as mock_get:
+            assert other._make_request({"function": "TEST"}) == {"test": "data"}
+            mock_get.assert_not_called()
+    
+    def test_run_async(self):
+        """Test blocking calls can be awaited."""
+        with AlphaVantageClient(api_key="test_key") as client:
+            result = asyncio.run(client._run_async(lambda a, b=0: a + b, 1, b=2))
+            assert result == 3
+    
+    def test_async_endpoint_method(self):
+        """Test async endpoint variants return the same data as sync ones."""
+        mock_data = {"Time Series (Daily)": {"2023-01-01": {"4. close": "155.00"}}}
+        
+        with AlphaVantageClient(api_key="test_key", max_concurrency=2) as client:
+            with patch.object(client, '_make_request', return_value=mock_data):
+                result = asyncio.run(client.stocks.aget_daily("AAPL"))
+        
+        assert result == mock_data["Time Series (Daily)"]
+    
+    def test_get_daily_many(self):
+        """Test batch requests return results in input order."""
+        def fake_request(params):
+            return {"Time Series (Daily)": {"2023-01-01": {"4. close": params["symbol"]}}}
+        
+        with AlphaVantageClient(api_key="test_key") as client:
+            with patch.object(client, '_make_request', side_effect=fake_request):
+                results = client.stocks.get_daily_many(["AAPL", "MSFT", "IBM"])
+        
+        assert [r["2023-01-01"]["4. close"] for r in results] == ["AAPL", "MSFT", "IBM"]
+    
+    def test_indicators_get_many(self):
+        """Test batch indicator requests return results in spec order."""
+        def fake_request(params, **kwargs):
+            return {f"Technical Analysis: {params['function']}": {"symbol": params["symbol"]}}
+        
+        specs = [
+            {"indicator": "RSI", "symbol": "AAPL", "time_period": 14},
+            {"indicator": "SMA", "symbol": "MSFT"},
+        ]
+        
+        with AlphaVantageClient(api_key="test_key") as client:
+            with patch.object(client, '_make_request', side_effect=fake_request):
+                results = client.indicators.get_many(specs)
+        
+        assert results == [{"symbol": "AAPL"}, {"symbol": "MSFT"}]
     
     def test_context_manager(self):
         """Test client as context manager."""
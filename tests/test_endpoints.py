@@ -1,7 +1,7 @@
 """Tests for Alpha Vantage API endpoints."""
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from alpha_grabber.client import AlphaVantageClient
 from alpha_grabber.endpoints.stocks import StocksEndpoint
@@ -11,82 +11,127 @@ from alpha_grabber.endpoints.indicators import IndicatorsEndpoint
 from alpha_grabber.exceptions import AlphaVantageError
 
 
+# A sample of the indicators every release must list
+EXPECTED_INDICATORS = {
+    "SMA": "Simple Moving Average",
+    "EMA": "Exponential Moving Average",
+    "RSI": "Relative Strength Index",
+    "MACD": "Moving Average Convergence/Divergence",
+}
+
+
+@pytest.fixture(scope="module")
+def stocks_ep():
+    """Mock client and stocks endpoint shared by the module's tests."""
+    client = Mock(spec=AlphaVantageClient)
+    return client, StocksEndpoint(client)
+
+
+@pytest.fixture(scope="module")
+def forex_ep():
+    """Mock client and forex endpoint shared by the module's tests."""
+    client = Mock(spec=AlphaVantageClient)
+    return client, ForexEndpoint(client)
+
+
+@pytest.fixture(scope="module")
+def crypto_ep():
+    """Mock client and crypto endpoint shared by the module's tests."""
+    client = Mock(spec=AlphaVantageClient)
+    return client, CryptoEndpoint(client)
+
+
+@pytest.fixture(scope="module")
+def indicators_ep():
+    """Mock client and indicators endpoint shared by the module's tests."""
+    client = Mock(spec=AlphaVantageClient)
+    return client, IndicatorsEndpoint(client)
+
+
+@pytest.fixture(autouse=True)
+def format_calls(monkeypatch):
+    """
+    Record (data, output_format) for each format_output call and return the
+    data unformatted; formatting is covered in test_utils.
+    """
+    calls = []
+    
+    def passthrough(data, output_format="json"):
+        calls.append((data, output_format))
+        return data
+    
+    for module in ("base", "stocks", "forex", "crypto", "indicators"):
+        monkeypatch.setattr(f"alpha_grabber.endpoints.{module}.format_output", passthrough)
+    return calls
+
+
+@pytest.fixture(autouse=True)
+def _reset(stocks_ep, forex_ep, crypto_ep, indicators_ep):
+    """Clear calls and configured results left on the shared mocks."""
+    for client, _ in (stocks_ep, forex_ep, crypto_ep, indicators_ep):
+        client.reset_mock(return_value=True, side_effect=True)
+
+
 class TestStocksEndpoint:
     """Test cases for StocksEndpoint."""
     
-    def setup_method(self):
-        """Setup test client and endpoint."""
-        self.client = Mock(spec=AlphaVantageClient)
-        self.endpoint = StocksEndpoint(self.client)
-    
-    def test_get_quote_success(self):
+    def test_get_quote_success(self, stocks_ep, format_calls):
         """Test successful quote retrieval."""
+        client, endpoint = stocks_ep
         mock_data = {
             "Global Quote": {
                 "01. symbol": "AAPL",
                 "05. price": "150.00"
             }
         }
-        self.client._make_request.return_value = mock_data
+        client._make_request.return_value = mock_data
+        
+        result = endpoint.get_quote("AAPL")
         
-        with patch('alpha_grabber.endpoints.stocks.format_output') as mock_format:
-            mock_format.return_value = mock_data["Global Quote"]
-            
-            result = self.endpoint.get_quote("AAPL")
-            
-            self.client._make_request.assert_called_once_with({
-                "function": "GLOBAL_QUOTE",
-                "symbol": "AAPL"
-            })
-            mock_format.assert_called_once_with(mock_data["Global Quote"], "json")
+        client._make_request.assert_called_once_with({
+            "function": "GLOBAL_QUOTE",
+            "symbol": "AAPL"
+        })
+        assert result == mock_data["Global Quote"]
+        assert format_calls == [(mock_data["Global Quote"], "json")]
     
-    def test_get_quote_no_data(self):
+    def test_get_quote_no_data(self, stocks_ep):
         """Test quote retrieval with no data."""
+        client, endpoint = stocks_ep
         mock_data = {"Meta Data": {"1. Information": "Daily Prices"}}
-        self.client._make_request.return_value = mock_data
+        client._make_request.return_value = mock_data
         
         with pytest.raises(AlphaVantageError, match="No quote data found"):
-            self.endpoint.get_quote("INVALID")
+            endpoint.get_quote("INVALID")
     
-    def test_get_daily_success(self):
-        """Test successful daily data retrieval."""
-        mock_data = {
-            "Time Series (Daily)": {
-                "2023-01-01": {
-                    "1. open": "150.00",
-                    "4. close": "155.00"
-                }
-            }
-        }
-        self.client._make_request.return_value = mock_data
+    def test_get_daily_full_streams_time_series(self, stocks_ep):
+        """Test full-size requests ask the client to stream the series."""
+        client, endpoint = stocks_ep
+        mock_data = {"Time Series (Daily)": {}}
+        client._make_request.return_value = mock_data
+        
+        endpoint.get_daily("AAPL", outputsize="full")
         
-        with patch('alpha_grabber.endpoints.stocks.format_output') as mock_format:
-            mock_format.return_value = mock_data["Time Series (Daily)"]
-            
-            result = self.endpoint.get_daily("AAPL")
-            
-            self.client._make_request.assert_called_once_with({
-                "function": "TIME_SERIES_DAILY_ADJUSTED",
-                "symbol": "AAPL",
-                "outputsize": "compact"
-            })
+        stream_keys = client._make_request.call_args[1]["stream_keys"]
+        assert stream_keys[0] == "Time Series (Daily)"
     
-    def test_get_daily_no_adjusted(self):
+    def test_get_daily_no_adjusted(self, stocks_ep):
         """Test daily data retrieval without adjustment."""
+        client, endpoint = stocks_ep
         mock_data = {"Time Series (Daily)": {}}
-        self.client._make_request.return_value = mock_data
+        client._make_request.return_value = mock_data
         
-        with patch('alpha_grabber.endpoints.stocks.format_output'):
-            self.endpoint.get_daily("AAPL", adjusted=False)
-            
-            self.client._make_request.assert_called_once_with({
-                "function": "TIME_SERIES_DAILY",
-                "symbol": "AAPL",
-                "outputsize": "compact"
-            })
+        endpoint.get_daily("AAPL", adjusted=False)
+        
+        client._make_request.assert_called_once_with({
+            "function": "TIME_SERIES_DAILY",
+            "symbol": "AAPL",
+            "outputsize": "compact"
+        })
     
-    def test_get_intraday_success(self):
+    def test_get_intraday_success(self, stocks_ep, format_calls):
         """Test successful intraday data retrieval."""
+        client, endpoint = stocks_ep
         mock_data = {
             "Time Series (5min)": {
                 "2023-01-01 09:30:00": {
@@ -95,32 +140,61 @@ class TestStocksEndpoint:
                 }
             }
         }
-        self.client._make_request.return_value = mock_data
+        client._make_request.return_value = mock_data
+        
+        result = endpoint.get_intraday("AAPL", interval="5min")
         
-        with patch('alpha_grabber.endpoints.stocks.format_output') as mock_format:
-            mock_format.return_value = mock_data["Time Series (5min)"]
-            
-            result = self.endpoint.get_intraday("AAPL", interval="5min")
-            
-            self.client._make_request.assert_called_once_with({
-                "function": "TIME_SERIES_INTRADAY",
-                "symbol": "AAPL",
-                "interval": "5min",
-                "adjusted": "true",
-                "outputsize": "compact"
-            })
+        client._make_request.assert_called_once_with({
+            "function": "TIME_SERIES_INTRADAY",
+            "symbol": "AAPL",
+            "interval": "5min",
+            "adjusted": "true",
+            "outputsize": "compact"
+        })
+        assert result == mock_data["Time Series (5min)"]
+        assert format_calls == [(mock_data["Time Series (5min)"], "json")]
+
+    def test_get_weekly_uses_function_key(self, stocks_ep):
+        """Test weekly data is read from the key matching the function."""
+        client, endpoint = stocks_ep
+        mock_data = {
+            "Meta Data": {"1. Information": "Weekly Adjusted Prices"},
+            "Weekly Adjusted Time Series": {
+                "2023-01-06": {"1. open": "150.00"}
+            }
+        }
+        client._make_request.return_value = mock_data
+
+        result = endpoint.get_weekly("AAPL")
+
+        assert result == mock_data["Weekly Adjusted Time Series"]
+
+    def test_get_weekly_falls_back_to_prefix(self, stocks_ep):
+        """Test an unexpected weekly key is still found by its prefix."""
+        client, endpoint = stocks_ep
+        mock_data = {
+            "Meta Data": {"1. Information": "Weekly Prices"},
+            "Weekly Time Series": {"2023-01-06": {"1. open": "150.00"}}
+        }
+        client._make_request.return_value = mock_data
+
+        result = endpoint.get_weekly("AAPL", adjusted=True)
+
+        assert result == mock_data["Weekly Time Series"]
+
+    def test_has_no_instance_dict(self, stocks_ep):
+        """Test endpoint instances only carry the client slot."""
+        client, endpoint = stocks_ep
+        assert not hasattr(endpoint, "__dict__")
+        assert endpoint.client is client
 
 
 class TestForexEndpoint:
     """Test cases for ForexEndpoint."""
     
-    def setup_method(self):
-        """Setup test client and endpoint."""
-        self.client = Mock(spec=AlphaVantageClient)
-        self.endpoint = ForexEndpoint(self.client)
-    
-    def test_get_exchange_rate_success(self):
+    def test_get_exchange_rate_success(self, forex_ep, format_calls):
         """Test successful exchange rate retrieval."""
+        client, endpoint = forex_ep
         mock_data = {
             "Realtime Currency Exchange Rate": {
                 "1. From_Currency Code": "USD",
@@ -128,54 +202,38 @@ class TestForexEndpoint:
                 "5. Exchange Rate": "0.85"
             }
         }
-        self.client._make_request.return_value = mock_data
+        client._make_request.return_value = mock_data
+        
+        result = endpoint.get_exchange_rate("USD", "EUR")
         
-        with patch('alpha_grabber.endpoints.forex.format_output') as mock_format:
-            mock_format.return_value = mock_data["Realtime Currency Exchange Rate"]
-            
-            result = self.endpoint.get_exchange_rate("USD", "EUR")
-            
-            self.client._make_request.assert_called_once_with({
-                "function": "CURRENCY_EXCHANGE_RATE",
-                "from_currency": "USD",
-                "to_currency": "EUR"
-            })
+        client._make_request.assert_called_once_with({
+            "function": "CURRENCY_EXCHANGE_RATE",
+            "from_currency": "USD",
+            "to_currency": "EUR"
+        })
+        assert result == mock_data["Realtime Currency Exchange Rate"]
+        assert format_calls == [(mock_data["Realtime Currency Exchange Rate"], "json")]
     
-    def test_get_daily_success(self):
-        """Test successful forex daily data retrieval."""
+    def test_get_intraday_uses_interval_key(self, forex_ep):
+        """Test the intraday key is resolved from the requested interval."""
+        client, endpoint = forex_ep
         mock_data = {
-            "Time Series FX (Daily)": {
-                "2023-01-01": {
-                    "1. open": "0.85",
-                    "4. close": "0.86"
-                }
-            }
+            "Time Series FX (5min)": {"2023-01-01 09:30:00": {"4. close": "0.80"}},
+            "Time Series FX (15min)": {"2023-01-01 09:30:00": {"4. close": "0.86"}}
         }
-        self.client._make_request.return_value = mock_data
+        client._make_request.return_value = mock_data
         
-        with patch('alpha_grabber.endpoints.forex.format_output') as mock_format:
-            mock_format.return_value = mock_data["Time Series FX (Daily)"]
-            
-            result = self.endpoint.get_daily("USD", "EUR")
-            
-            self.client._make_request.assert_called_once_with({
-                "function": "FX_DAILY",
-                "from_symbol": "USD",
-                "to_symbol": "EUR",
-                "outputsize": "compact"
-            })
+        result = endpoint.get_intraday("USD", "EUR", interval="15min")
+        
+        assert result == mock_data["Time Series FX (15min)"]
 
 
 class TestCryptoEndpoint:
     """Test cases for CryptoEndpoint."""
     
-    def setup_method(self):
-        """Setup test client and endpoint."""
-        self.client = Mock(spec=AlphaVantageClient)
-        self.endpoint = CryptoEndpoint(self.client)
-    
-    def test_get_exchange_rate_success(self):
+    def test_get_exchange_rate_success(self, crypto_ep, format_calls):
         """Test successful crypto exchange rate retrieval."""
+        client, endpoint = crypto_ep
         mock_data = {
             "Realtime Currency Exchange Rate": {
                 "1. From_Currency Code": "BTC",
@@ -183,111 +241,115 @@ class TestCryptoEndpoint:
                 "5. Exchange Rate": "45000.00"
             }
         }
-        self.client._make_request.return_value = mock_data
+        client._make_request.return_value = mock_data
         
-        with patch('alpha_grabber.endpoints.crypto.format_output') as mock_format:
-            mock_format.return_value = mock_data["Realtime Currency Exchange Rate"]
-            
-            result = self.endpoint.get_exchange_rate("BTC", "USD")
-            
-            self.client._make_request.assert_called_once_with({
-                "function": "CURRENCY_EXCHANGE_RATE",
-                "from_currency": "BTC",
-                "to_currency": "USD"
-            })
-    
-    def test_get_daily_success(self):
-        """Test successful crypto daily data retrieval."""
-        mock_data = {
-            "Time Series (Digital Currency Daily)": {
-                "2023-01-01": {
-                    "1a. open (USD)": "45000.00",
-                    "4a. close (USD)": "46000.00"
-                }
-            }
-        }
-        self.client._make_request.return_value = mock_data
+        result = endpoint.get_exchange_rate("BTC", "USD")
         
-        with patch('alpha_grabber.endpoints.crypto.format_output') as mock_format:
-            mock_format.return_value = mock_data["Time Series (Digital Currency Daily)"]
-            
-            result = self.endpoint.get_daily("BTC", "USD")
-            
-            self.client._make_request.assert_called_once_with({
-                "function": "DIGITAL_CURRENCY_DAILY",
-                "symbol": "BTC",
-                "market": "USD"
-            })
+        client._make_request.assert_called_once_with({
+            "function": "CURRENCY_EXCHANGE_RATE",
+            "from_currency": "BTC",
+            "to_currency": "USD"
+        })
+        assert result == mock_data["Realtime Currency Exchange Rate"]
+        assert format_calls == [(mock_data["Realtime Currency Exchange Rate"], "json")]
 
 
 class TestIndicatorsEndpoint:
     """Test cases for IndicatorsEndpoint."""
     
-    def setup_method(self):
-        """Setup test client and endpoint."""
-        self.client = Mock(spec=AlphaVantageClient)
-        self.endpoint = IndicatorsEndpoint(self.client)
+    def test_get_sma_bypass_cache(self, indicators_ep):
+        """Test indicators can be force-refreshed past the cache."""
+        client, endpoint = indicators_ep
+        client._make_request.return_value = {"Technical Analysis: SMA": {}}
+        
+        endpoint.get_sma("AAPL", bypass_cache=True)
+        
+        assert client._make_request.call_args[1] == {"bypass_cache": True}
     
-    def test_get_sma_success(self):
-        """Test successful SMA retrieval."""
-        mock_data = {
-            "Technical Analysis: SMA": {
-                "2023-01-01": {
-                    "SMA": "150.00"
-                }
-            }
-        }
-        self.client._make_request.return_value = mock_data
+    def test_get_sma_no_data(self, indicators_ep):
+        """Test indicator retrieval with no technical analysis data."""
+        client, endpoint = indicators_ep
+        client._make_request.return_value = {"Meta Data": {}}
         
-        with patch('alpha_grabber.endpoints.indicators.format_output') as mock_format:
-            mock_format.return_value = mock_data["Technical Analysis: SMA"]
-            
-            result = self.endpoint.get_sma("AAPL", time_period=20)
-            
-            self.client._make_request.assert_called_once_with({
-                "function": "SMA",
-                "symbol": "AAPL",
-                "interval": "daily",
-                "time_period": "20",
-                "series_type": "close"
-            })
+        with pytest.raises(AlphaVantageError, match="No technical analysis data"):
+            endpoint.get_sma("AAPL")
     
-    def test_get_indicator_unknown(self):
+    def test_get_indicator_unknown(self, indicators_ep):
         """Test getting unknown indicator."""
+        client, endpoint = indicators_ep
         with pytest.raises(AlphaVantageError, match="Unknown indicator"):
-            self.endpoint.get_indicator("UNKNOWN", "AAPL")
+            endpoint.get_indicator("UNKNOWN", "AAPL")
     
-    def test_list_indicators(self):
+    def test_list_indicators(self, indicators_ep):
         """Test listing available indicators."""
-        indicators = self.endpoint.list_indicators()
+        client, endpoint = indicators_ep
+        indicators = endpoint.list_indicators()
         
         assert isinstance(indicators, dict)
-        assert "SMA" in indicators
-        assert "EMA" in indicators
-        assert "RSI" in indicators
-        assert "MACD" in indicators
-        assert indicators["SMA"] == "Simple Moving Average"
+        assert EXPECTED_INDICATORS.items() <= indicators.items()
+    
+    def test_list_indicators_without_client(self, indicators_ep):
+        """Test indicators can be listed from the class itself."""
+        client, endpoint = indicators_ep
+        assert IndicatorsEndpoint.list_indicators() == endpoint.list_indicators()
     
-    def test_get_indicator_with_params(self):
+    def test_get_indicator_with_params(self, indicators_ep):
         """Test getting indicator with additional parameters."""
+        client, endpoint = indicators_ep
         mock_data = {
             "Technical Analysis: RSI": {
                 "2023-01-01": {"RSI": "65.00"}
             }
         }
-        self.client._make_request.return_value = mock_data
+        client._make_request.return_value = mock_data
         
-        with patch('alpha_grabber.endpoints.indicators.format_output') as mock_format:
-            mock_format.return_value = mock_data["Technical Analysis: RSI"]
-            
-            result = self.endpoint.get_indicator(
-                "RSI", 
-                "AAPL", 
-                time_period=14,
-                series_type="close"
-            )
-            
-            # Check that parameters were converted to strings
-            call_args = self.client._make_request.call_args[0][0]
-            assert call_args["time_period"] == "14"
-            assert call_args["series_type"] == "close"
+        result = endpoint.get_indicator(
+            "RSI", 
+            "AAPL", 
+            time_period=14,
+            series_type="close"
+        )
+        
+        # Check that parameters were converted to strings
+        call_args = client._make_request.call_args[0][0]
+        assert call_args["time_period"] == "14"
+        assert call_args["series_type"] == "close"
+        assert result == mock_data["Technical Analysis: RSI"]
+
+
+@pytest.mark.parametrize("endpoint_fixture, method, args, key, params, options", [
+    (
+        "stocks_ep", "get_daily", ("AAPL",), "Time Series (Daily)",
+        {"function": "TIME_SERIES_DAILY_ADJUSTED", "symbol": "AAPL", "outputsize": "compact"},
+        {},
+    ),
+    (
+        "forex_ep", "get_daily", ("USD", "EUR"), "Time Series FX (Daily)",
+        {"function": "FX_DAILY", "from_symbol": "USD", "to_symbol": "EUR", "outputsize": "compact"},
+        {},
+    ),
+    (
+        "crypto_ep", "get_daily", ("BTC", "USD"), "Time Series (Digital Currency Daily)",
+        {"function": "DIGITAL_CURRENCY_DAILY", "symbol": "BTC", "market": "USD"},
+        {},
+    ),
+    (
+        "indicators_ep", "get_sma", ("AAPL",), "Technical Analysis: SMA",
+        {"function": "SMA", "symbol": "AAPL", "interval": "daily",
+         "time_period": "20", "series_type": "close"},
+        {"bypass_cache": False},
+    ),
+])
+def test_endpoint_dispatch(
+    request, format_calls, endpoint_fixture, method, args, key, params, options
+):
+    """Test endpoint methods send the expected query and format its series."""
+    client, endpoint = request.getfixturevalue(endpoint_fixture)
+    series = {"2023-01-01": {"4. close": "155.00"}}
+    client._make_request.return_value = {key: series}
+    
+    result = getattr(endpoint, method)(*args, output_format="csv")
+    
+    assert result == series
+    assert format_calls == [(series, "csv")]
+    client._make_request.assert_called_once_with(params, **options)
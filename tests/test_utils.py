@@ -0,0 +1,315 @@
+"""Tests for utility functions."""
+
+import io
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+import pandas as pd
+
+from alpha_grabber.utils import (
+    clean_column_names,
+    flat_dict_to_csv,
+    format_output,
+    is_flat_dict,
+    is_time_series_data,
+    time_series_to_csv,
+    validate_interval,
+    validate_symbol,
+)
+from alpha_grabber.exceptions import DataFormatError
+
+
+@pytest.mark.slow
+def test_import_does_not_load_pandas():
+    """Test importing the CLI leaves pandas unloaded until it is needed."""
+    code = "import sys, alpha_grabber.cli; sys.exit('pandas' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+class TestFormatOutput:
+    """Test cases for format_output."""
+    
+    def test_json_passthrough(self):
+        """Test JSON output returns the data unchanged."""
+        data = {"01. symbol": "AAPL"}
+        assert format_output(data, "json") is data
+    
+    def test_format_is_case_insensitive(self):
+        """Test output formats are matched regardless of case."""
+        assert format_output({"a": "1"}, "CSV") == "a\n1\n"
+    
+    def test_unsupported_format(self):
+        """Test unsupported formats raise an error."""
+        with pytest.raises(DataFormatError, match="Unsupported output format"):
+            format_output({"a": "1"}, "xml")
+    
+    def test_dataframe_time_series(self):
+        """Test time series are converted to a typed DataFrame."""
+        data = {
+            "2023-01-02": {"1. open": "151.00", "5. volume": "2000"},
+            "2023-01-01": {"1. open": "150.00", "5. volume": "1000"}
+        }
+        
+        df = format_output(data, "dataframe")
+        
+        assert list(df.columns) == ["1. open", "5. volume"]
+        assert df.index.name == "date"
+        assert df.index[0] == pd.Timestamp("2023-01-02")
+        assert df["1. open"].dtype == "float64"
+        assert df["1. open"].tolist() == [151.0, 150.0]
+        assert df["5. volume"].dtype == "int64"
+    
+    def test_dataframe_fractional_volume(self):
+        """Test fractional or missing volumes fall back to float."""
+        data = {
+            "2023-01-02": {"5. volume": "12.5"},
+            "2023-01-01": {"1. open": "150.00"}
+        }
+        
+        df = format_output(data, "dataframe")
+        
+        assert df["5. volume"].dtype == "float64"
+        assert df["5. volume"].iloc[0] == 12.5
+        assert pd.isna(df["5. volume"].iloc[1])
+    
+    def test_dataframe_intraday_timestamps(self):
+        """Test intraday timestamps are parsed with their time component."""
+        data = {"2023-01-01 09:35:00": {"4. close": "155.00"}}
+        
+        df = format_output(data, "dataframe")
+        
+        assert df.index[0] == pd.Timestamp("2023-01-01 09:35:00")
+    
+    def test_dataframe_minute_timestamps(self):
+        """Test indicator timestamps without seconds use an explicit format."""
+        data = {
+            "2023-01-01 09:35": {"SMA": "150.10"},
+            "2023-01-01 09:30": {"SMA": "150.00"}
+        }
+        
+        df = format_output(data, "dataframe")
+        
+        assert df.index.tolist() == [
+            pd.Timestamp("2023-01-01 09:35"),
+            pd.Timestamp("2023-01-01 09:30"),
+        ]
+    
+    def test_dataframe_flat_dict(self):
+        """Test flat data becomes a single-row DataFrame."""
+        df = format_output({"01. symbol": "AAPL", "05. price": "150.00"}, "dataframe")
+        
+        assert len(df) == 1
+        assert df.loc[0, "01. symbol"] == "AAPL"
+
+
+class TestBinaryFormats:
+    """Test cases for Parquet and Feather output."""
+    
+    DATA = {
+        "2023-01-02": {"1. open": "151.00", "5. volume": "2000"},
+        "2023-01-01": {"1. open": "150.00", "5. volume": "1000"}
+    }
+    
+    @pytest.mark.parametrize("output_format", ["parquet", "feather"])
+    def test_round_trip(self, output_format):
+        """Test time series are written with a date column and numeric values."""
+        pytest.importorskip("pyarrow")
+        
+        payload = format_output(self.DATA, output_format)
+        df = getattr(pd, f"read_{output_format}")(io.BytesIO(payload))
+        
+        assert list(df.columns) == ["date", "1. open", "5. volume"]
+        assert df["1. open"].tolist() == [151.0, 150.0]
+    
+    def test_flat_numeric_fields_typed(self):
+        """Test numeric fields of flat data are stored as numbers."""
+        pytest.importorskip("pyarrow")
+        data = {"01. symbol": "AAPL", "05. price": "150.00", "10. change percent": "1.69%"}
+        
+        df = pd.read_parquet(io.BytesIO(format_output(data, "parquet")))
+        
+        assert df["05. price"].dtype == "float64"
+        assert df.loc[0, "01. symbol"] == "AAPL"
+        assert df.loc[0, "10. change percent"] == "1.69%"
+    
+    def test_missing_pyarrow(self):
+        """Test a clear error is raised when pyarrow is not installed."""
+        with patch.dict(sys.modules, {"pyarrow": None}):
+            with pytest.raises(DataFormatError, match="requires pyarrow"):
+                format_output(self.DATA, "parquet")
+
+
+class TestTimeSeriesToCsv:
+    """Test cases for time_series_to_csv."""
+    
+    def test_rows_sorted_most_recent_first(self):
+        """Test rows are written newest first under a date column."""
+        data = {
+            "2023-01-01": {"1. open": "150.00", "5. volume": "1000"},
+            "2023-01-02": {"1. open": "151.00", "5. volume": "2000"}
+        }
+        
+        assert time_series_to_csv(data).splitlines() == [
+            "date,1. open,5. volume",
+            "2023-01-02,151.00,2000",
+            "2023-01-01,150.00,1000",
+        ]
+    
+    def test_writes_to_buffer(self):
+        """Test rows can be streamed into a caller's text buffer."""
+        data = {"2023-01-01": {"1. open": "150.00"}}
+        buf = io.StringIO()
+        
+        assert time_series_to_csv(data, buf) is None
+        assert buf.getvalue() == "date,1. open\n2023-01-01,150.00\n"
+    
+    def test_missing_fields_left_empty(self):
+        """Test rows missing a field get an empty cell."""
+        data = {
+            "2023-01-02": {"1. open": "151.00"},
+            "2023-01-01": {"1. open": "150.00", "7. dividend amount": "0.23"}
+        }
+        
+        assert time_series_to_csv(data).splitlines() == [
+            "date,1. open,7. dividend amount",
+            "2023-01-02,151.00,",
+            "2023-01-01,150.00,0.23",
+        ]
+
+
+class TestFlatDictToCsv:
+    """Test cases for flat_dict_to_csv."""
+    
+    def test_keeps_column_order(self):
+        """Test columns follow the dictionary's key order."""
+        csv = flat_dict_to_csv({"05. price": "150.00", "01. symbol": "AAPL"})
+        
+        assert csv.splitlines() == ["05. price,01. symbol", "150.00,AAPL"]
+    
+    def test_equal_content_reuses_result(self):
+        """Test equal payloads are only converted once."""
+        first = flat_dict_to_csv({"01. symbol": "AAPL", "05. price": "150.00"})
+        second = flat_dict_to_csv({"01. symbol": "AAPL", "05. price": "150.00"})
+        
+        assert second is first
+    
+    def test_changed_content_is_reconverted(self):
+        """Test a payload with new values is not served stale output."""
+        flat_dict_to_csv({"01. symbol": "AAPL", "05. price": "150.00"})
+        csv = flat_dict_to_csv({"01. symbol": "AAPL", "05. price": "151.00"})
+        
+        assert "151.00" in csv
+    
+    def test_equal_values_of_different_types(self):
+        """Test values that compare equal keep their own rendering."""
+        rows = [
+            flat_dict_to_csv({"a": value}).splitlines()[1]
+            for value in (1, True, 1.0)
+        ]
+        
+        assert rows == ["1", "True", "1.0"]
+    
+    def test_nested_payload_via_format_output(self):
+        """Test non time series payloads with nested values become one row."""
+        csv = format_output({"a": {"x": "1"}, "b": "2"}, "csv")
+        
+        assert csv.splitlines() == ["a,b", "{'x': '1'},2"]
+    
+    def test_writes_to_buffer(self):
+        """Test the row can be written into a caller's text buffer."""
+        buf = io.StringIO()
+        
+        assert flat_dict_to_csv({"01. symbol": "AAPL"}, buf) is None
+        assert buf.getvalue() == "01. symbol\nAAPL\n"
+    
+    def test_unhashable_values(self):
+        """Test payloads with list values are still converted."""
+        csv = flat_dict_to_csv({"symbols": ["AAPL"]})
+        
+        assert csv.splitlines()[0] == "symbols"
+
+
+class TestCleanColumnNames:
+    """Test cases for clean_column_names."""
+    
+    def test_strips_prefix_and_normalizes(self):
+        """Test numbered prefixes are dropped and names snake-cased."""
+        df = pd.DataFrame(columns=["1. open", "5. adjusted close", "Market Cap"])
+        
+        assert list(clean_column_names(df).columns) == [
+            "open", "adjusted_close", "market_cap"
+        ]
+
+
+class TestShapeDetection:
+    """Test cases for is_time_series_data and is_flat_dict."""
+    
+    def test_time_series(self):
+        """Test dated rows are detected as a time series."""
+        data = {f"2023-01-{day:02d}": {"4. close": "1.0"} for day in range(1, 29)}
+        
+        assert is_time_series_data(data)
+        assert not is_flat_dict(data)
+    
+    def test_flat_dict(self):
+        """Test quote-like payloads are detected as flat."""
+        data = {"01. symbol": "AAPL", "05. price": "150.00"}
+        
+        assert is_flat_dict(data)
+        assert not is_time_series_data(data)
+    
+    def test_empty(self):
+        """Test an empty payload is not a time series."""
+        assert not is_time_series_data({})
+    
+    def test_late_non_dict_value(self):
+        """Test a non-dict value after the first rows is still detected."""
+        data = {f"2023-01-{day:02d}": {"4. close": "1.0"} for day in range(1, 6)}
+        data["2023-01-06"] = "n/a"
+        
+        assert not is_time_series_data(data)
+        assert not is_flat_dict(data)
+        assert format_output(data, "csv").startswith("2023-01-01,")
+
+
+class TestValidateInterval:
+    """Test cases for validate_interval."""
+    
+    def test_valid_interval(self):
+        """Test supported intervals are returned unchanged."""
+        assert validate_interval("15min") == "15min"
+    
+    def test_invalid_interval(self):
+        """Test unsupported intervals list the valid choices."""
+        with pytest.raises(ValueError, match="Valid intervals: 1min, 5min, .*, monthly"):
+            validate_interval("2min")
+
+
+class TestValidateSymbol:
+    """Test cases for validate_symbol."""
+    
+    def test_normalizes_symbol(self):
+        """Test symbols are stripped and uppercased."""
+        assert validate_symbol(" brk.b ") == "BRK.B"
+    
+    def test_invalid_characters(self):
+        """Test symbols with unsupported characters are rejected."""
+        with pytest.raises(ValueError, match="Invalid symbol format"):
+            validate_symbol("AA PL")
+    
+    def test_blank_symbol(self):
+        """Test whitespace-only symbols are rejected."""
+        with pytest.raises(ValueError, match="Invalid symbol format"):
+            validate_symbol("   ")
+    
+    def test_non_string(self):
+        """Test non-string symbols are rejected before normalizing."""
+        with pytest.raises(ValueError, match="non-empty string"):
+            validate_symbol(["AAPL"])
+    
+    def test_too_long(self):
+        """Test symbols over ten characters are rejected."""
+        with pytest.raises(ValueError, match="Symbol too long"):
+            validate_symbol("ABCDEFGHIJK")